@@ -4,10 +4,19 @@ from flask_cors import CORS
 from config import Config
 from routes.auth_routes import auth_routes
 from routes.event_routes import event_routes
+from routes.metrics_routes import metrics_routes, prometheus_routes
+from utils.clerk_auth import UserIdentityCache
+from utils.compression import ResponseCompressor
 from utils.database_manager import DatabaseManager
 from utils.email_service import EmailService
 from utils.image_upload_manager import ImageUploadManager
+from utils.json_provider import FastJSONProvider
+from utils.jwks_cache import JWKSCache
+from utils.notification_queue import NotificationQueue
 from utils.participant_notifier import EmailParticipantNotifier, EventNotificationManager
+from utils.request_metrics import RequestMetrics
+from utils.response_cache import ResponseCache
+from utils.token_cache import VerifiedTokenCache
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -22,6 +31,9 @@ app.config['SECRET_KEY'] = config.SECRET_KEY
 app.config['IMGBB_API_KEY'] = config.IMGBB_API_KEY
 app.config['SQLALCHEMY_DATABASE_URI'] = config.SQLALCHEMY_DATABASE_URI
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = config.SQLALCHEMY_TRACK_MODIFICATIONS
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = config.SQLALCHEMY_ENGINE_OPTIONS
+app.config['SQLALCHEMY_REPLICA_URIS'] = config.SQLALCHEMY_REPLICA_URIS
+app.config['DB_REPLICA_STICKY_SECONDS'] = config.DB_REPLICA_STICKY_SECONDS
 app.config['MAX_CONTENT_LENGTH'] = config.MAX_CONTENT_LENGTH
 
 # Email Configuration
@@ -33,6 +45,38 @@ app.config['MAIL_USERNAME'] = config.MAIL_USERNAME
 app.config['MAIL_PASSWORD'] = config.MAIL_PASSWORD
 app.config['MAIL_DEFAULT_SENDER'] = config.MAIL_DEFAULT_SENDER
 
+# Notification Worker Configuration
+app.config['NOTIFICATION_WORKER_ENABLED'] = config.NOTIFICATION_WORKER_ENABLED
+app.config['NOTIFICATION_POLL_INTERVAL'] = config.NOTIFICATION_POLL_INTERVAL
+app.config['NOTIFICATION_MAX_ATTEMPTS'] = config.NOTIFICATION_MAX_ATTEMPTS
+
+# Response Cache Configuration
+app.config['CACHE_BACKEND'] = config.CACHE_BACKEND
+app.config['CACHE_DEFAULT_TTL'] = config.CACHE_DEFAULT_TTL
+app.config['CACHE_MAX_ENTRIES'] = config.CACHE_MAX_ENTRIES
+app.config['CACHE_REDIS_URL'] = config.CACHE_REDIS_URL
+app.config['HTTP_CACHE_MAX_AGE'] = config.HTTP_CACHE_MAX_AGE
+app.config['CLERK_VERIFY_SIGNATURE'] = config.CLERK_VERIFY_SIGNATURE
+app.config['CLERK_JWKS_URL'] = config.CLERK_JWKS_URL
+app.config['CLERK_JWKS_TTL'] = config.CLERK_JWKS_TTL
+app.config['CLERK_ISSUER'] = config.CLERK_ISSUER
+app.config['CLERK_CLOCK_SKEW_SECONDS'] = config.CLERK_CLOCK_SKEW_SECONDS
+app.config['TOKEN_CACHE_MAX_ENTRIES'] = config.TOKEN_CACHE_MAX_ENTRIES
+app.config['TOKEN_CACHE_MAX_TTL'] = config.TOKEN_CACHE_MAX_TTL
+app.config['AUTH_USER_CACHE_TTL'] = config.AUTH_USER_CACHE_TTL
+app.config['AUTH_USER_CACHE_MAX_ENTRIES'] = config.AUTH_USER_CACHE_MAX_ENTRIES
+
+# Response Encoding Configuration
+app.config['JSON_ENCODER'] = config.JSON_ENCODER
+app.config['COMPRESS_MIN_SIZE'] = config.COMPRESS_MIN_SIZE
+app.config['COMPRESS_GZIP_LEVEL'] = config.COMPRESS_GZIP_LEVEL
+app.config['COMPRESS_BROTLI_QUALITY'] = config.COMPRESS_BROTLI_QUALITY
+
+# Request Instrumentation Configuration
+app.config['QUERY_BUDGET'] = config.QUERY_BUDGET
+app.config['SERVER_TIMING'] = config.SERVER_TIMING
+app.config['METRICS_TOKEN'] = config.METRICS_TOKEN
+
 # Initialize ImageUploadManager singleton
 image_manager = ImageUploadManager.get_instance()
 image_manager.set_api_key(config.IMGBB_API_KEY)
@@ -45,6 +89,30 @@ email_service.init_app(app)
 notification_manager = EventNotificationManager.get_instance()
 notification_manager.attach_observer(EmailParticipantNotifier())
 
+# Initialize Notification Queue (Singleton) - outbox drained by a background worker
+notification_queue = NotificationQueue.get_instance()
+notification_queue.init_app(app, dispatch=notification_manager.notify_participants)
+
+# Initialize Response Cache (Singleton) for event detail/listing reads
+response_cache = ResponseCache.get_instance()
+response_cache.init_app(app)
+
+# Initialize Clerk JWKS Cache (Singleton) - signing keys held in memory, refreshed in the background
+JWKSCache.get_instance().init_app(app)
+
+# Initialize Verified Token Cache (Singleton) - skips repeat signature checks until a token expires
+VerifiedTokenCache.get_instance().init_app(app)
+
+# Initialize User Identity Cache (Singleton) for authenticated routes
+UserIdentityCache.get_instance().init_app(app)
+
+# Per-route latency / SQL / size metrics; registered before compression so sizes are measured on the wire
+RequestMetrics.get_instance().init_app(app)
+
+# JSON responses via orjson when installed; gzip/brotli compression negotiated per request
+app.json = FastJSONProvider(app)
+ResponseCompressor.get_instance().init_app(app)
+
 # Disable automatic trailing slash redirects
 app.url_map.strict_slashes = False
 
@@ -63,6 +131,8 @@ db = DatabaseManager.init_app(app)
 # Register Blueprints
 app.register_blueprint(auth_routes, url_prefix='/api/auth')
 app.register_blueprint(event_routes, url_prefix='/api/events')
+app.register_blueprint(metrics_routes, url_prefix='/api/metrics')
+app.register_blueprint(prometheus_routes)
 
 # Import models after db initialization
 
@@ -70,4 +140,7 @@ app.register_blueprint(event_routes, url_prefix='/api/events')
 DatabaseManager.create_all(app)
 
 if __name__ == '__main__':
+    # Drain notifications left pending by a previous run
+    if config.NOTIFICATION_WORKER_ENABLED:
+        notification_queue.wake()
     app.run(debug=True)
@@ -0,0 +1,85 @@
+"""
+Clerk Token Verification Benchmark
+Measures per-request token verification cost against the local fake JWKS server:
+unverified decoding (development mode), RS256 with a JWKS fetch per request (the naive approach),
+RS256 with the warm in-memory JWKSCache, and the same with the verified-token cache in front.
+
+Usage: python auth_benchmark.py [requests] [latency_ms]
+"""
+
+import sys
+import time
+
+import jwt
+import requests
+from flask import Flask
+
+from fake_jwks_server import FakeJWKSServer
+from utils.clerk_auth import verify_clerk_session_token
+from utils.jwks_cache import JWKSCache
+from utils.token_cache import VerifiedTokenCache
+
+
+def make_app(verify, jwks_url=None):
+    app = Flask(__name__)
+    app.config.update(CLERK_VERIFY_SIGNATURE=verify, CLERK_JWKS_URL=jwks_url)
+    return app
+
+
+def verify_with_fetch(token, jwks_url):
+    """Naive verification: download the key set on every request."""
+    kid = jwt.get_unverified_header(token)['kid']
+    keys = requests.get(jwks_url, timeout=5).json()['keys']
+    key = jwt.PyJWK(next(jwk for jwk in keys if jwk['kid'] == kid))
+    return jwt.decode(token, key.key, algorithms=['RS256'])
+
+
+def timed(count, verify):
+    start = time.perf_counter()
+    for _ in range(count):
+        if not verify():
+            raise RuntimeError('Verification failed')
+    return (time.perf_counter() - start) / count * 1_000_000
+
+
+def run_benchmark(count=500, latency_ms=0):
+    server = FakeJWKSServer(port=0, latency_ms=latency_ms).start()
+    token = server.issue_token('user_benchmark')
+    results = []
+    try:
+        with make_app(verify=False).app_context():
+            results.append(('unverified decode', timed(count, lambda: verify_clerk_session_token(token)), 0))
+
+        server.requests = 0
+        micros = timed(count, lambda: verify_with_fetch(token, server.url))
+        results.append(('RS256, JWKS fetch per request', micros, server.requests))
+
+        JWKSCache.reset_instance()
+        app = make_app(verify=True, jwks_url=server.url)
+        JWKSCache.get_instance().init_app(app)
+        server.requests = 0
+        with app.app_context():
+            results.append(('RS256, cached JWKS', timed(count, lambda: verify_clerk_session_token(token)), server.requests))
+
+            VerifiedTokenCache.reset_instance()
+            token_cache = VerifiedTokenCache.get_instance()
+            micros = timed(count, lambda: token_cache.verify(token, verify_clerk_session_token, 'clerk'))
+            results.append(('RS256, cached JWKS + token cache', micros, server.requests))
+        JWKSCache.reset_instance()
+    finally:
+        server.stop()
+    return results
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 0
+    print('=' * 70)
+    print(f'TOKEN VERIFICATION BENCHMARK ({count} requests, {latency_ms}ms JWKS latency)')
+    print('=' * 70)
+    print(f'{"mode":<34} {"us/request":>12} {"JWKS fetches":>14}')
+    for mode, micros, fetches in run_benchmark(count, latency_ms):
+        print(f'{mode:<34} {micros:>12.1f} {fetches:>14}')
+    stats = VerifiedTokenCache.get_instance().stats()
+    print(f'Token cache hit rate: {stats["hit_rate"]:.2%}')
+    print(f'Verification CPU spent: {stats["verify_cpu_ms"]}ms, saved by hits: {stats["cpu_saved_ms"]}ms')
@@ -33,6 +33,22 @@ class Config:
                 f'mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}/{self.MYSQL_DB}'
             )
             self.SQLALCHEMY_TRACK_MODIFICATIONS = False
+            # Read replicas (comma-separated URIs) for GET requests; clients read the primary for a while after writing
+            self.SQLALCHEMY_REPLICA_URIS = [uri.strip() for uri in os.getenv('DB_REPLICA_URIS', '').split(',') if uri.strip()]
+            self.DB_REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS', 5))
+            # Connection pool: recycle below MySQL's wait_timeout so idle connections are never dropped under us
+            self.SQLALCHEMY_ENGINE_OPTIONS = {
+                'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+                'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 20)),
+                'pool_timeout': int(os.getenv('DB_POOL_TIMEOUT', 30)),
+                'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+                'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'True').lower() == 'true',
+                'connect_args': {
+                    'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', 10)),
+                    'read_timeout': int(os.getenv('DB_READ_TIMEOUT', 30)),
+                    'write_timeout': int(os.getenv('DB_WRITE_TIMEOUT', 30)),
+                },
+            }
             self.MAX_CONTENT_LENGTH = 1 * 1024 * 1024  # 1MB max file size for uploads
 
             # Email Configuration
@@ -43,6 +59,51 @@ class Config:
             self.MAIL_USERNAME = os.getenv('MAIL_USERNAME')
             self.MAIL_PASSWORD = os.getenv('MAIL_PASSWORD')
             self.MAIL_DEFAULT_SENDER = os.getenv('MAIL_DEFAULT_SENDER', self.MAIL_USERNAME)
+            # Bulk sends reuse one SMTP session, reconnecting after this many messages
+            self.MAIL_MAX_MESSAGES_PER_CONNECTION = int(os.getenv('MAIL_MAX_MESSAGES_PER_CONNECTION', 100))
+            # Parallel dispatch: SMTP worker threads, global send rate (0 = unlimited) and per-message retries
+            self.MAIL_DISPATCH_WORKERS = int(os.getenv('MAIL_DISPATCH_WORKERS', 4))
+            self.MAIL_RATE_LIMIT_PER_MINUTE = float(os.getenv('MAIL_RATE_LIMIT_PER_MINUTE', 0))
+            self.MAIL_SEND_RETRIES = int(os.getenv('MAIL_SEND_RETRIES', 3))
+            self.MAIL_RETRY_BACKOFF_SECONDS = float(os.getenv('MAIL_RETRY_BACKOFF_SECONDS', 1))
+            # Seconds to wait on an SMTP connect or reply before the session is dropped and the message retried
+            self.MAIL_TIMEOUT = float(os.getenv('MAIL_TIMEOUT', 30))
+
+            # Notification Worker Configuration
+            self.NOTIFICATION_WORKER_ENABLED = os.getenv('NOTIFICATION_WORKER_ENABLED', 'True').lower() == 'true'
+            self.NOTIFICATION_POLL_INTERVAL = float(os.getenv('NOTIFICATION_POLL_INTERVAL', 5))
+            self.NOTIFICATION_MAX_ATTEMPTS = int(os.getenv('NOTIFICATION_MAX_ATTEMPTS', 5))
+
+            # Response Cache Configuration ('memory', 'redis' or 'none')
+            self.CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'memory').lower()
+            self.CACHE_DEFAULT_TTL = int(os.getenv('CACHE_DEFAULT_TTL', 60))
+            self.CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 1024))
+            self.CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+            # Clerk Token Verification (signature checks need the JWKS URL, e.g. https://<frontend-api>/.well-known/jwks.json)
+            self.CLERK_VERIFY_SIGNATURE = os.getenv('CLERK_VERIFY_SIGNATURE', 'False').lower() == 'true'
+            self.CLERK_JWKS_URL = os.getenv('CLERK_JWKS_URL')
+            self.CLERK_JWKS_TTL = int(os.getenv('CLERK_JWKS_TTL', 3600))
+            self.CLERK_ISSUER = os.getenv('CLERK_ISSUER')
+            self.CLERK_CLOCK_SKEW_SECONDS = int(os.getenv('CLERK_CLOCK_SKEW_SECONDS', 5))
+
+            # Verified token claims cache, shared by both auth decorators (0 entries disables)
+            self.TOKEN_CACHE_MAX_ENTRIES = int(os.getenv('TOKEN_CACHE_MAX_ENTRIES', 4096))
+            self.TOKEN_CACHE_MAX_TTL = int(os.getenv('TOKEN_CACHE_MAX_TTL', 3600))
+            # Verified Clerk user -> local user cache (0 TTL disables)
+            self.AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', 300))
+            self.AUTH_USER_CACHE_MAX_ENTRIES = int(os.getenv('AUTH_USER_CACHE_MAX_ENTRIES', 1024))
+            # Seconds clients may reuse event responses before revalidating with ETag / Last-Modified
+            self.HTTP_CACHE_MAX_AGE = int(os.getenv('HTTP_CACHE_MAX_AGE', 0))
+            # Response encoding: JSON encoder ('auto' = orjson if installed, 'orjson', 'stdlib') and compression
+            self.JSON_ENCODER = os.getenv('JSON_ENCODER', 'auto').lower()
+            self.COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+            self.COMPRESS_GZIP_LEVEL = int(os.getenv('COMPRESS_GZIP_LEVEL', 6))
+            self.COMPRESS_BROTLI_QUALITY = int(os.getenv('COMPRESS_BROTLI_QUALITY', 8))
+            # Request instrumentation: warn above QUERY_BUDGET SQL statements per request (0 disables)
+            self.QUERY_BUDGET = int(os.getenv('QUERY_BUDGET', 25))
+            self.SERVER_TIMING = os.getenv('SERVER_TIMING', 'False').lower() == 'true'
+            # Bearer token for /metrics and /api/metrics/*; unset keeps them disabled
+            self.METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
 
             Config._initialized = True
 
@@ -0,0 +1,66 @@
+"""
+Email Dispatch Benchmark
+Measures bulk send throughput (messages/sec) of the dispatch engine at 1, 4 and 16 workers
+against the local fake SMTP server. No real email is sent.
+
+Usage: python email_benchmark.py [messages] [latency_ms]
+"""
+
+import sys
+
+from flask import Flask
+from flask_mail import Mail
+
+from fake_smtp_server import FakeSMTPServer
+from utils.email_dispatcher import EmailDispatcher
+
+WORKER_COUNTS = (1, 4, 16)
+
+
+def make_mail(port):
+    app = Flask(__name__)
+    app.config.update(
+        MAIL_SERVER='127.0.0.1',
+        MAIL_PORT=port,
+        MAIL_USE_TLS=False,
+        MAIL_USE_SSL=False,
+        MAIL_USERNAME='bench',
+        MAIL_PASSWORD='bench',
+        MAIL_DEFAULT_SENDER='bench@eventsynk.local',
+    )
+    mail = Mail(app)
+    return app, mail
+
+
+def messages(count):
+    for i in range(count):
+        yield f'participant{i}@example.com', 'Benchmark', f'Dear Participant {i},\n\nBenchmark body.', None
+
+
+def run_benchmark(count=2000, latency_ms=5):
+    server = FakeSMTPServer(port=0, latency_ms=latency_ms).start()
+    app, mail = make_mail(server.port)
+    results = []
+    try:
+        for workers in WORKER_COUNTS:
+            server.reset_counters()
+            dispatcher = EmailDispatcher(mail, app, workers=workers, max_per_connection=100, timeout=10)
+            stats = dispatcher.dispatch(messages(count))
+            results.append((workers, stats, server.connections))
+    finally:
+        server.stop()
+    return results
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print('=' * 60)
+    print(f'EMAIL DISPATCH BENCHMARK ({count} messages, {latency_ms}ms server latency)')
+    print('=' * 60)
+    print(f'{"workers":>8} {"sent":>8} {"failed":>8} {"conns":>8} {"seconds":>10} {"msg/s":>10}')
+    for workers, stats, connections in run_benchmark(count, latency_ms):
+        print(
+            f'{workers:>8} {stats["success"]:>8} {stats["failed"]:>8} {connections:>8} '
+            f'{stats["elapsed_seconds"]:>10} {stats["messages_per_second"]:>10}'
+        )
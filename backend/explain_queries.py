@@ -0,0 +1,106 @@
+"""
+Query Plan Check
+Runs EXPLAIN on the hot route queries and reports whether each table access uses an index.
+Exits non-zero if any query falls back to a full table scan.
+
+By default the plans come from a throwaway SQLite database built by the migrations (EXPLAIN QUERY PLAN).
+Pass --database-uri to check a migrated MySQL database instead (`flask db upgrade` first); it is only read.
+
+Usage: python explain_queries.py [--database-uri URI]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+from flask import Flask
+from flask_migrate import upgrade
+from sqlalchemy import text
+
+from models import Event, Registration, RegistrationField, RegistrationFieldResponse, db
+from routes.event_routes import LISTING_PROJECTIONS, _event_listing_query
+from utils.database_manager import DatabaseManager
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+
+def make_app(database_uri):
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=database_uri)
+    DatabaseManager.init_app(app)
+    return app
+
+
+def route_queries():
+    """(label, query) pairs mirroring the queries issued by the event routes."""
+    summary = LISTING_PROJECTIONS['summary']
+    return [
+        ('list_events page', _event_listing_query(summary).order_by(Event.date, Event.id).limit(21)),
+        (
+            'list_events category page',
+            _event_listing_query(summary).filter(Event.category == 'Tech').order_by(Event.date).limit(21),
+        ),
+        ('registration count', db.session.query(Registration.id).filter(Registration.event_id == 1)),
+        ('duplicate registration check', Registration.query.filter_by(event_id=1, user_id=1).limit(1)),
+        ('participants by event', Registration.query.filter_by(event_id=1)),
+        ('registration fields by event', RegistrationField.query.filter_by(event_id=1)),
+        ('field responses by registration', RegistrationFieldResponse.query.filter_by(registration_id=1)),
+        ('events by organiser', Event.query.filter_by(organiser_id=1)),
+        ('registrations by user', Registration.query.filter_by(user_id=1)),
+    ]
+
+
+def compile_sql(query):
+    return str(query.statement.compile(dialect=db.engine.dialect, compile_kwargs={'literal_binds': True}))
+
+
+def full_scans(sql):
+    """Return a description of every table access in the plan that does not use an index."""
+    if db.engine.dialect.name == 'sqlite':
+        rows = db.session.execute(text(f'EXPLAIN QUERY PLAN {sql}')).mappings().all()
+        return [row['detail'] for row in rows if row['detail'].startswith('SCAN') and 'INDEX' not in row['detail']]
+
+    rows = db.session.execute(text(f'EXPLAIN {sql}')).mappings().all()
+    # Derived tables (<derivedN>) are materialized subqueries, their inner accesses are listed separately
+    return [
+        f'{row["table"]} (type={row["type"]})' for row in rows if row['key'] is None and not str(row['table']).startswith('<')
+    ]
+
+
+def check_query_plans(database_uri=None):
+    db_file = None
+    if database_uri is None:
+        fd, db_file = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        database_uri = f'sqlite:///{db_file}'
+
+    app = make_app(database_uri)
+    failures = 0
+    with app.app_context():
+        if db_file:
+            # The schema the migrations build, so the plans reflect the indexes they create
+            upgrade(directory=MIGRATIONS_DIR)
+        print(f'Database: {db.engine.url.render_as_string(hide_password=True)}')
+        for label, query in route_queries():
+            scans = full_scans(compile_sql(query))
+            if scans:
+                failures += 1
+                print(f'❌ {label}: full scan on {", ".join(scans)}')
+            else:
+                print(f'✅ {label}: index used')
+        db.session.remove()
+        db.engine.dispose()
+    if db_file:
+        os.remove(db_file)
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check that the hot route queries use an index.')
+    parser.add_argument('--database-uri', help='migrated database to EXPLAIN against (default: throwaway SQLite)')
+    args = parser.parse_args()
+    print('=' * 60)
+    print('QUERY PLAN CHECK')
+    print('=' * 60)
+    sys.exit(1 if check_query_plans(args.database_uri) else 0)
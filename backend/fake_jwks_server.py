@@ -0,0 +1,117 @@
+"""
+Fake JWKS Server
+Local stand-in for Clerk's JWKS endpoint, for developing and benchmarking signature verification.
+Generates RSA signing keys, serves them at /.well-known/jwks.json and issues RS256 session tokens
+signed with the current key. Can simulate network latency and key rotation.
+
+Usage: python fake_jwks_server.py [port] [latency_ms] [sub]
+Then set CLERK_VERIFY_SIGNATURE=True and CLERK_JWKS_URL=http://127.0.0.1:<port>/.well-known/jwks.json
+and use the printed token as the Bearer token for the given sub.
+"""
+
+import json
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+JWKS_PATH = '/.well-known/jwks.json'
+
+
+class _JWKSHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        if self.path != JWKS_PATH:
+            self.send_error(404)
+            return
+        server.record_request()
+        if server.latency:
+            time.sleep(server.latency)
+        body = json.dumps(server.jwks()).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeJWKSServer(ThreadingHTTPServer):
+    """Threaded JWKS stand-in; `requests` counts key set fetches."""
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=8026, latency_ms=0, issuer='http://127.0.0.1'):
+        super().__init__((host, port), _JWKSHandler)
+        self.latency = latency_ms / 1000
+        self.issuer = issuer
+        self.requests = 0
+        self._keys = []  # (kid, private key), newest last
+        self._lock = threading.Lock()
+        self._thread = None
+        self.rotate()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self.port}{JWKS_PATH}'
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def rotate(self):
+        """Add a new signing key; tokens issued from now on use it. Returns its kid."""
+        kid = uuid.uuid4().hex
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        with self._lock:
+            self._keys.append((kid, key))
+        return kid
+
+    def jwks(self):
+        keys = []
+        for kid, key in self._keys:
+            jwk = json.loads(RSAAlgorithm.to_jwk(key.public_key()))
+            jwk.update(kid=kid, use='sig', alg='RS256')
+            keys.append(jwk)
+        return {'keys': keys}
+
+    def issue_token(self, sub, expires_in=3600):
+        """RS256 session token for `sub`, signed with the newest key."""
+        kid, key = self._keys[-1]
+        now = int(time.time())
+        payload = {'sub': sub, 'iss': self.issuer, 'iat': now, 'nbf': now, 'exp': now + expires_in}
+        return jwt.encode(payload, key, algorithm='RS256', headers={'kid': kid})
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-jwks', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8026
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 0
+    sub = sys.argv[3] if len(sys.argv) > 3 else 'user_local'
+    server = FakeJWKSServer(port=port, latency_ms=latency_ms)
+    print(f'🔑 Fake JWKS server listening on {server.url} (latency {latency_ms}ms)')
+    print(f'   Token for {sub} (1h): {server.issue_token(sub)}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f'\n📊 {server.requests} JWKS requests')
@@ -0,0 +1,104 @@
+"""
+Fake SMTP Server
+Local stand-in for an SMTP provider, for developing and benchmarking email delivery.
+Accepts any AUTH credentials, counts messages instead of delivering them, and can simulate
+per-message latency and rejected recipients.
+
+Usage: python fake_smtp_server.py [port] [latency_ms]
+"""
+
+import socketserver
+import sys
+import threading
+import time
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode('ascii'))
+
+    def handle(self):
+        server = self.server
+        server.record('connections')
+        self.reply('220 fake-smtp ready')
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('utf-8', 'replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+
+            if verb == 'EHLO':
+                self.reply('250-fake-smtp')
+                self.reply('250 AUTH PLAIN LOGIN')
+            elif verb == 'AUTH':
+                self.reply('235 Authentication successful')
+            elif verb == 'RCPT' and server.reject_domain and server.reject_domain in command:
+                self.reply('550 No such user')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                if server.latency:
+                    time.sleep(server.latency)
+                server.record('messages')
+                self.reply('250 Message accepted')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                # HELO, MAIL, RCPT, RSET, NOOP
+                self.reply('250 OK')
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """Threaded SMTP stand-in; `connections` and `messages` count what it received."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+    # The default backlog of 5 drops connection attempts when many workers connect at once
+    request_queue_size = 128
+
+    def __init__(self, host='127.0.0.1', port=8025, latency_ms=0, reject_domain=None):
+        super().__init__((host, port), _SMTPHandler)
+        self.latency = latency_ms / 1000
+        self.reject_domain = reject_domain
+        self.connections = 0
+        self.messages = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def record(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def reset_counters(self):
+        with self._lock:
+            self.connections = 0
+            self.messages = 0
+
+    def start(self):
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-smtp', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8025
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 0
+    server = FakeSMTPServer(port=port, latency_ms=latency_ms)
+    print(f'📭 Fake SMTP server listening on 127.0.0.1:{port} (latency {latency_ms}ms)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f'\n📊 {server.messages} messages over {server.connections} connections')
@@ -0,0 +1,57 @@
+"""add event full text search
+
+FULLTEXT index on MySQL; on SQLite an FTS5 table kept in sync by triggers, backfilled from existing events.
+Batch operations on `event` under SQLite rebuild the table and drop its triggers, so later migrations
+that batch-alter `event` must re-run EVENT_FTS_SQLITE_DDL.
+
+Revision ID: 0007_event_search
+Revises: 0006_waitlist
+Create Date: 2026-10-18 01:18:40.086754
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '0007_event_search'
+down_revision = '0006_waitlist'
+branch_labels = None
+depends_on = None
+
+# Snapshot of models.EVENT_FTS_SQLITE_DDL
+_FTS_INSERT = (
+    'INSERT INTO event_fts(rowid, title, description, eligibility) '
+    'VALUES (new.id, new.title, new.description, new.eligibility);'
+)
+_FTS_DELETE = (
+    'INSERT INTO event_fts(event_fts, rowid, title, description, eligibility) '
+    "VALUES ('delete', old.id, old.title, old.description, old.eligibility);"
+)
+SQLITE_DDL = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS event_fts USING fts5(title, description, eligibility, '
+    "content='event', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f'CREATE TRIGGER IF NOT EXISTS event_fts_ai AFTER INSERT ON event BEGIN {_FTS_INSERT} END',
+    f'CREATE TRIGGER IF NOT EXISTS event_fts_ad AFTER DELETE ON event BEGIN {_FTS_DELETE} END',
+    'CREATE TRIGGER IF NOT EXISTS event_fts_au AFTER UPDATE OF title, description, eligibility ON event '
+    f'BEGIN {_FTS_DELETE} {_FTS_INSERT} END',
+)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.create_index('ft_event_text', 'event', ['title', 'description', 'eligibility'], mysql_prefix='FULLTEXT')
+    elif dialect == 'sqlite':
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+        op.execute("INSERT INTO event_fts(event_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'mysql':
+        op.drop_index('ft_event_text', table_name='event')
+    elif dialect == 'sqlite':
+        for trigger in ('event_fts_ai', 'event_fts_ad', 'event_fts_au'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS event_fts')
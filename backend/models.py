@@ -1,5 +1,7 @@
 from datetime import datetime
 
+from sqlalchemy import DDL, event
+
 from utils.database_manager import DatabaseManager
 
 # Get database instance from DatabaseManager singleton
@@ -34,11 +36,50 @@ class Event(db.Model):
     participation_type = db.Column(db.String(50), nullable=True)  # 'Individual' or 'Team'
     team_size = db.Column(db.Integer, nullable=True)  # Max team size for team events
     organiser_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    # Maintained by register/cancel with atomic increments; repaired by reconcile_counts.py
+    registration_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # Capacity enforced atomically against registration_count; None = unlimited
+    max_participants = db.Column(db.Integer, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     registrations = db.relationship('Registration', backref='event', lazy=True, cascade='all, delete-orphan')
     registration_fields = db.relationship('RegistrationField', backref='event', lazy=True, cascade='all, delete-orphan')
+    waitlist = db.relationship('Waitlist', backref='event', lazy=True, cascade='all, delete-orphan')
+
+    __table_args__ = (
+        # Listing order and keyset pagination seek on (date, id)
+        db.Index('ix_event_date_id', 'date', 'id'),
+        # Category filter combined with date ordering
+        db.Index('ix_event_category_date', 'category', 'date'),
+        # Organiser's own events (get_user_events)
+        db.Index('ix_event_organiser_date', 'organiser_id', 'date'),
+        # Full-text search (utils/event_search.py); SQLite uses the event_fts table below instead
+        db.Index('ft_event_text', 'title', 'description', 'eligibility', mysql_prefix='FULLTEXT').ddl_if(dialect='mysql'),
+    )
+
+
+# SQLite full-text search: an FTS5 index over the event table, kept in sync by triggers
+_FTS_INSERT = (
+    'INSERT INTO event_fts(rowid, title, description, eligibility) '
+    'VALUES (new.id, new.title, new.description, new.eligibility);'
+)
+_FTS_DELETE = (
+    'INSERT INTO event_fts(event_fts, rowid, title, description, eligibility) '
+    "VALUES ('delete', old.id, old.title, old.description, old.eligibility);"
+)
+EVENT_FTS_SQLITE_DDL = (
+    'CREATE VIRTUAL TABLE IF NOT EXISTS event_fts USING fts5(title, description, eligibility, '
+    "content='event', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f'CREATE TRIGGER IF NOT EXISTS event_fts_ai AFTER INSERT ON event BEGIN {_FTS_INSERT} END',
+    f'CREATE TRIGGER IF NOT EXISTS event_fts_ad AFTER DELETE ON event BEGIN {_FTS_DELETE} END',
+    'CREATE TRIGGER IF NOT EXISTS event_fts_au AFTER UPDATE OF title, description, eligibility ON event '
+    f'BEGIN {_FTS_DELETE} {_FTS_INSERT} END',
+)
+
+for statement in EVENT_FTS_SQLITE_DDL:
+    event.listen(Event.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+event.listen(Event.__table__, 'before_drop', DDL('DROP TABLE IF EXISTS event_fts').execute_if(dialect='sqlite'))
 
 
 class Registration(db.Model):
@@ -51,10 +92,35 @@ class Registration(db.Model):
         'RegistrationFieldResponse', backref='registration', lazy=True, cascade='all, delete-orphan'
     )
 
+    __table_args__ = (
+        # One registration per user per event; also serves counts and participant lists by event_id
+        db.Index('uq_registration_event_user', 'event_id', 'user_id', unique=True),
+        # A user's registrations (get_user_registrations)
+        db.Index('ix_registration_user_event', 'user_id', 'event_id'),
+    )
+
+
+class Waitlist(db.Model):
+    """A user queued for a full event; promoted in joined_at order when a place frees up."""
 
-class RegistrationField(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    joined_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    # Validated registration answers [{field_id, response_value}], stored on promotion
+    responses = db.Column(db.JSON, nullable=True)
+
+    __table_args__ = (
+        # One entry per user per event
+        db.Index('uq_waitlist_event_user', 'event_id', 'user_id', unique=True),
+        # Head of an event's queue (and a user's position) by index seek
+        db.Index('ix_waitlist_event_joined', 'event_id', 'joined_at', 'id'),
+    )
+
+
+class RegistrationField(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False, index=True)
     field_name = db.Column(db.String(100), nullable=False)
     field_type = db.Column(db.String(50), nullable=False)
     is_required = db.Column(db.Boolean, default=False)
@@ -67,3 +133,45 @@ class RegistrationFieldResponse(db.Model):
     registration_id = db.Column(db.Integer, db.ForeignKey('registration.id'), nullable=False)
     field_id = db.Column(db.Integer, db.ForeignKey('registration_field.id'), nullable=False)
     response_value = db.Column(db.Text, nullable=False)
+
+    __table_args__ = (db.Index('ix_field_response_registration_field', 'registration_id', 'field_id'),)
+
+
+class NotificationBatch(db.Model):
+    """Outbox row: one participant notification (update/cancel) waiting for or processed by the worker."""
+
+    id = db.Column(db.Integer, primary_key=True)
+    # No FK: cancellation batches must outlive the deleted event
+    event_id = db.Column(db.Integer, nullable=False)
+    requested_by = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
+    event_type = db.Column(db.String(50), nullable=False)
+    event_data = db.Column(db.JSON, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending/processing/completed/failed
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    recipient_count = db.Column(db.Integer, nullable=False, default=0)
+    sent_count = db.Column(db.Integer, nullable=False, default=0)
+    failed_count = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    next_attempt_at = db.Column(db.DateTime, default=datetime.utcnow)
+    locked_at = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    recipients = db.relationship('NotificationRecipient', backref='batch', lazy=True, cascade='all, delete-orphan')
+
+    __table_args__ = (
+        # Worker poll: due pending batches
+        db.Index('ix_notification_batch_status_next_attempt', 'status', 'next_attempt_at'),
+    )
+
+
+class NotificationRecipient(db.Model):
+    """Recipients snapshotted at enqueue time, so cancellations still reach users after the event is deleted."""
+
+    id = db.Column(db.Integer, primary_key=True)
+    batch_id = db.Column(db.Integer, db.ForeignKey('notification_batch.id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), nullable=False)
+    # Set once the email is delivered, so a retried batch only streams the rest
+    sent_at = db.Column(db.DateTime, nullable=True)
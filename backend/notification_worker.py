@@ -0,0 +1,16 @@
+"""
+Notification Worker
+Runs the participant notification outbox worker as a dedicated process.
+Set NOTIFICATION_WORKER_ENABLED=False for the API processes when using this.
+"""
+
+from app import app, notification_queue
+
+if __name__ == '__main__':
+    print('=' * 60)
+    print('NOTIFICATION WORKER')
+    print('=' * 60)
+    with app.app_context():
+        processed = notification_queue.process_pending()
+    print(f'\n📬 Drained {processed} pending batch(es), now polling for new notifications...')
+    notification_queue.run_forever()
@@ -0,0 +1,64 @@
+"""
+Registration Counter Reconciliation
+Recomputes Event.registration_count from the registration table in bulk and reports drift.
+Pass --dry-run to only report.
+"""
+
+import sys
+
+from sqlalchemy import func, update
+
+from app import app, db
+from models import Event, Registration
+
+
+def find_drift():
+    """Return (event_id, stored_count, actual_count) for every event whose counter is wrong."""
+    actual_counts = (
+        db.session.query(Registration.event_id, func.count(Registration.id).label('actual'))
+        .group_by(Registration.event_id)
+        .subquery()
+    )
+    actual = func.coalesce(actual_counts.c.actual, 0)
+    return (
+        db.session.query(Event.id, Event.registration_count, actual)
+        .outerjoin(actual_counts, actual_counts.c.event_id == Event.id)
+        .filter(Event.registration_count != actual)
+        .all()
+    )
+
+
+def reconcile(dry_run=False):
+    with app.app_context():
+        drift = find_drift()
+        for event_id, stored, actual in drift:
+            print(f'   Event #{event_id}: stored {stored}, actual {actual} ({actual - stored:+d})')
+
+        if drift and not dry_run:
+            # Single bulk UPDATE with a correlated count, limited to the drifted rows
+            actual_count = (
+                db.session.query(func.count(Registration.id)).filter(Registration.event_id == Event.id).scalar_subquery()
+            )
+            db.session.execute(
+                update(Event)
+                .where(Event.id.in_([event_id for event_id, _, _ in drift]))
+                .values(registration_count=actual_count)
+                .execution_options(synchronize_session=False)
+            )
+            db.session.commit()
+
+        return len(drift)
+
+
+if __name__ == '__main__':
+    dry_run = '--dry-run' in sys.argv
+    print('=' * 60)
+    print('REGISTRATION COUNTER RECONCILIATION')
+    print('=' * 60)
+    drifted = reconcile(dry_run=dry_run)
+    if not drifted:
+        print('\n✅ All registration counters are accurate.')
+    elif dry_run:
+        print(f'\n⚠️  {drifted} event(s) drifted (dry run, nothing changed).')
+    else:
+        print(f'\n✅ Repaired {drifted} drifted event counter(s).')
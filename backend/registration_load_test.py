@@ -0,0 +1,188 @@
+"""
+Registration Load Test
+Fires concurrent POST /api/events/<id>/register requests at a capacity-limited event and checks
+that the event is filled exactly: no overbooking, no duplicate registrations, and a counter that
+matches the registration table. Some users deliberately register twice.
+Users turned away then join the waitlist, and half of the registered users cancel concurrently:
+every freed place must go to the head of the waitlist, in order, without errors.
+
+Runs against a throwaway SQLite database by default; pass a database URI to use a MySQL stand-in
+(all tables are created on it and dropped afterwards, so never point it at a real database).
+
+Usage: python registration_load_test.py [requests] [capacity] [database_uri]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import jwt
+from flask import Flask
+from sqlalchemy import func
+
+from models import Event, Registration, User, Waitlist, db
+from routes.event_routes import event_routes
+from utils.database_manager import DatabaseManager
+
+WORKERS = 64
+DUPLICATE_EVERY = 10
+
+
+def make_app(database_uri):
+    engine_options = {'pool_size': WORKERS, 'max_overflow': 0}
+    if database_uri.startswith('sqlite'):
+        # SQLite serializes writers on the file lock; wait for it instead of failing
+        engine_options['connect_args'] = {'timeout': 30}
+
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=database_uri,
+        SQLALCHEMY_ENGINE_OPTIONS=engine_options,
+        CLERK_VERIFY_SIGNATURE=False,
+    )
+    app.url_map.strict_slashes = False
+    DatabaseManager.init_app(app)
+    app.register_blueprint(event_routes, url_prefix='/api/events')
+    return app
+
+
+def seed(user_count, capacity):
+    organiser = User(clerk_user_id='load_organiser', name='Organiser', email='organiser@example.com')
+    db.session.add(organiser)
+    db.session.flush()
+    event = Event(
+        title='Load test',
+        description='Capacity-limited event',
+        date=datetime.utcnow() + timedelta(days=7),
+        deadline=datetime.utcnow() + timedelta(days=6),
+        category='Tech',
+        organiser_id=organiser.id,
+        max_participants=capacity,
+    )
+    db.session.add(event)
+    db.session.bulk_insert_mappings(
+        User, [{'clerk_user_id': f'load_{i}', 'name': f'User {i}', 'email': f'user{i}@example.com'} for i in range(user_count)]
+    )
+    db.session.commit()
+    return event.id
+
+
+def run_load_test(requests=1000, capacity=100, database_uri=None):
+    db_file = None
+    if database_uri is None:
+        fd, db_file = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        database_uri = f'sqlite:///{db_file}'
+
+    # Every DUPLICATE_EVERY-th request re-sends the user of an earlier request
+    users = []
+    distinct_users = 0
+    for i in range(requests):
+        if i % DUPLICATE_EVERY == DUPLICATE_EVERY - 1:
+            users.append(users[i // DUPLICATE_EVERY])
+        else:
+            users.append(distinct_users)
+            distinct_users += 1
+
+    app = make_app(database_uri)
+    with app.app_context():
+        db.create_all()
+        event_id = seed(distinct_users, capacity)
+
+    client = app.test_client()
+    # Unverified development tokens: the test exercises registration, not signature checks
+    tokens = [jwt.encode({'sub': f'load_{user}'}, 'load-test', algorithm='HS256') for user in users]
+
+    def register(token):
+        response = client.post(f'/api/events/{event_id}/register', json={}, headers={'Authorization': f'Bearer {token}'})
+        return response.status_code
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        results = list(executor.map(register, tokens))
+    elapsed = time.perf_counter() - start
+    statuses = Counter(results)
+
+    def registration_state():
+        registrations = db.session.query(Registration).filter(Registration.event_id == event_id)
+        registered_users = {user_id for (user_id,) in registrations.with_entities(Registration.user_id)}
+        distinct = registrations.with_entities(func.count(func.distinct(Registration.user_id))).scalar()
+        counter = db.session.get(Event, event_id).registration_count
+        return registrations.count(), distinct, counter, registered_users
+
+    with app.app_context():
+        registered, distinct, counter, registered_users = registration_state()
+        db.session.remove()
+
+    # Turned-away users queue up one by one, so the waitlist order is known
+    registered_clerk_ids = _clerk_ids(app, registered_users)
+    waitlisted = [f'load_{user}' for user in dict.fromkeys(users) if f'load_{user}' not in registered_clerk_ids]
+    for clerk_id in waitlisted:
+        token = jwt.encode({'sub': clerk_id}, 'load-test', algorithm='HS256')
+        client.post(f'/api/events/{event_id}/waitlist', json={}, headers={'Authorization': f'Bearer {token}'})
+
+    def cancel(clerk_id):
+        token = jwt.encode({'sub': clerk_id}, 'load-test', algorithm='HS256')
+        return client.delete(f'/api/events/{event_id}/register', headers={'Authorization': f'Bearer {token}'}).status_code
+
+    cancelling = sorted(registered_clerk_ids)[: registered // 2]
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        cancel_statuses = Counter(executor.map(cancel, cancelling))
+
+    with app.app_context():
+        after, distinct_after, counter_after, users_after = registration_state()
+        promoted = _clerk_ids(app, users_after - registered_users)
+        still_waiting = db.session.query(Waitlist).filter(Waitlist.event_id == event_id).count()
+        db.session.remove()
+        db.drop_all()
+    if db_file:
+        os.remove(db_file)
+
+    expected = min(capacity, distinct_users)
+    refilled = min(len(cancelling), len(waitlisted))
+    checks = {
+        'filled exactly to capacity': registered == expected,
+        'no duplicate registrations': distinct == registered,
+        'counter matches registrations': counter == registered,
+        'one 201 per registration': statuses[201] == registered,
+        'no server errors': not any(status >= 500 for status in statuses),
+        'every cancellation succeeds': cancel_statuses[200] == len(cancelling),
+        'freed places go to the waitlist head in order': promoted == set(waitlisted[:refilled]),
+        'no duplicates after cancellations': distinct_after == after,
+        'counter matches after cancellations': counter_after == after == registered - len(cancelling) + refilled,
+        'waitlist shrinks by the promotions': still_waiting == len(waitlisted) - refilled,
+    }
+    return {
+        'statuses': dict(statuses),
+        'cancel_statuses': dict(cancel_statuses),
+        'registered': registered,
+        'counter': counter,
+        'promoted': len(promoted),
+        'elapsed': elapsed,
+        'checks': checks,
+    }
+
+
+def _clerk_ids(app, user_ids):
+    with app.app_context():
+        return {clerk_id for (clerk_id,) in db.session.query(User.clerk_user_id).filter(User.id.in_(user_ids))}
+
+
+if __name__ == '__main__':
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    capacity = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    database_uri = sys.argv[3] if len(sys.argv) > 3 else None
+    print('=' * 60)
+    print(f'REGISTRATION LOAD TEST ({requests} concurrent requests, capacity {capacity})')
+    print('=' * 60)
+    result = run_load_test(requests, capacity, database_uri)
+    print(f'Responses: {result["statuses"]} in {result["elapsed"]:.2f}s')
+    print(f'Registrations: {result["registered"]}, counter: {result["counter"]}')
+    print(f'Cancellations: {result["cancel_statuses"]}, promoted from waitlist: {result["promoted"]}')
+    for name, passed in result['checks'].items():
+        print(f'{"✅" if passed else "❌"} {name}')
+    sys.exit(0 if all(result['checks'].values()) else 1)
@@ -0,0 +1,158 @@
+"""
+Read Replica Routing Check
+Runs the event API against three SQLite files, a primary and two replicas, each seeded with a different
+event title, so it is visible which database answered. Checks that anonymous GETs read a replica, that
+every statement of one request goes to the same replica (while requests spread over both), that writes
+go to the primary, and that a user who just wrote reads the primary (its own writes), with any of their
+session tokens, until DB_REPLICA_STICKY_SECONDS have passed.
+
+Pass three database URIs (e.g. local MySQL containers) instead of the temporary SQLite files;
+all tables are created on them and dropped afterwards, so never point it at real databases.
+
+Usage: python replica_routing_check.py [primary_uri replica_uri replica_uri]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import jwt
+from flask import Flask
+from sqlalchemy import create_engine, event
+
+from models import Event, Registration, User, db
+from routes.event_routes import event_routes
+from utils.database_manager import DatabaseManager
+from utils.response_cache import ResponseCache
+
+STICKY_SECONDS = 1
+REPLICAS = ('replica_a', 'replica_b')
+SPREAD_REQUESTS = 40
+
+
+def make_app(primary_uri, replica_uris):
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI=primary_uri,
+        SQLALCHEMY_REPLICA_URIS=list(replica_uris),
+        DB_REPLICA_STICKY_SECONDS=STICKY_SECONDS,
+        # The response cache would answer repeated GETs without touching either database
+        CACHE_BACKEND='none',
+        CLERK_VERIFY_SIGNATURE=False,
+    )
+    app.url_map.strict_slashes = False
+    DatabaseManager.init_app(app)
+    ResponseCache.get_instance().init_app(app)
+    app.register_blueprint(event_routes, url_prefix='/api/events')
+    return app
+
+
+def seed(engine, title):
+    """Same users and event on both databases; only the title differs."""
+    db.metadata.create_all(engine)
+    now = datetime.utcnow()
+    with engine.begin() as connection:
+        connection.execute(
+            User.__table__.insert(),
+            [
+                {'id': 1, 'clerk_user_id': 'replica_organiser', 'name': 'Organiser', 'email': 'organiser@example.com'},
+                {'id': 2, 'clerk_user_id': 'replica_user', 'name': 'User', 'email': 'user@example.com'},
+            ],
+        )
+        connection.execute(
+            Event.__table__.insert(),
+            {
+                'id': 1,
+                'title': title,
+                'description': 'Replica routing check',
+                'date': now + timedelta(days=7),
+                'deadline': now + timedelta(days=6),
+                'category': 'Tech',
+                'organiser_id': 1,
+                'registration_count': 0,
+                'created_at': now,
+                'updated_at': now,
+            },
+        )
+
+
+def run_check(uris=None):
+    db_files = []
+    if not uris:
+        for _ in range(1 + len(REPLICAS)):
+            fd, path = tempfile.mkstemp(suffix='.db')
+            os.close(fd)
+            db_files.append(path)
+        uris = [f'sqlite:///{path}' for path in db_files]
+
+    names = ('primary',) + REPLICAS
+    engines = {name: create_engine(uri) for name, uri in zip(names, uris)}
+    for name, engine in engines.items():
+        seed(engine, name)
+
+    app = make_app(uris[0], uris[1:])
+    client = app.test_client()
+    token = jwt.encode({'sub': 'replica_user'}, 'replica-check', algorithm='HS256')
+    writer = {'Authorization': f'Bearer {token}'}
+    # Clerk rotates session tokens: the same user with a different token must still read its writes
+    refreshed = jwt.encode({'sub': 'replica_user', 'sid': 'refreshed'}, 'replica-check', algorithm='HS256')
+    writer_refreshed = {'Authorization': f'Bearer {refreshed}'}
+
+    def title(headers=None):
+        return client.get('/api/events/1', headers=headers).get_json()['event']['title']
+
+    def registrations(name):
+        with engines[name].connect() as connection:
+            return connection.execute(Registration.__table__.select()).fetchall()
+
+    # Which replica engines ran statements, per request (the listing runs its ETag validator and its rows)
+    with app.app_context():
+        app_replicas = {key: db.engines[key] for key in DatabaseManager._replica_keys}
+    touched = set()
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        touched.update(key for key, engine in app_replicas.items() if conn.engine is engine)
+
+    for engine in app_replicas.values():
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    per_request = []
+    for i in range(SPREAD_REQUESTS):
+        touched.clear()
+        client.get('/api/events/' if i % 2 else '/api/events/1')
+        per_request.append(set(touched))
+    for engine in app_replicas.values():
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+    checks = {'anonymous GET reads a replica': title() in REPLICAS}
+    checks['each request reads a single replica'] = all(len(used) == 1 for used in per_request)
+    checks['requests spread over both replicas'] = set().union(*per_request) == set(app_replicas)
+    status = client.post('/api/events/1/register', json={}, headers=writer).status_code
+    checks['write lands on the primary'] = status == 201 and len(registrations('primary')) == 1
+    checks['replicas are not written'] = not any(registrations(name) for name in REPLICAS)
+    checks['writer reads its own writes from the primary'] = title(writer) == 'primary'
+    checks['writer keeps the primary with a refreshed token'] = title(writer_refreshed) == 'primary'
+    checks['other clients keep reading a replica'] = title() in REPLICAS
+    time.sleep(STICKY_SECONDS + 0.1)
+    checks['writer returns to a replica afterwards'] = title(writer) in REPLICAS
+
+    with app.app_context():
+        db.session.remove()
+    for engine in engines.values():
+        db.metadata.drop_all(engine)
+        engine.dispose()
+    for path in db_files:
+        os.remove(path)
+    return checks
+
+
+if __name__ == '__main__':
+    uris = sys.argv[1:4] if len(sys.argv) > 3 else None
+    print('=' * 60)
+    print('READ REPLICA ROUTING CHECK')
+    print('=' * 60)
+    checks = run_check(uris)
+    for name, passed in checks.items():
+        print(f'{"✅" if passed else "❌"} {name}')
+    sys.exit(0 if all(checks.values()) else 1)
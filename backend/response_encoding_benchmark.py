@@ -0,0 +1,166 @@
+"""
+Response Encoding Benchmark
+Measures the list_events payload for a seeded catalog: time to JSON-encode it with the standard library
+and with orjson (when installed), and bytes on the wire without compression, with gzip and with brotli
+(when installed), plus the whole request time for each combination, served fresh and from the response
+cache (whose hits reuse a stored compressed variant). Ends with a gzip level / brotli quality sweep over the
+payload for picking COMPRESS_GZIP_LEVEL and COMPRESS_BROTLI_QUALITY. Uses a throwaway SQLite database.
+
+Usage: python response_encoding_benchmark.py [events] [repeats]
+"""
+
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+from models import Event, User, db
+from routes.event_routes import _event_listing_query, event_routes
+from utils.compression import ResponseCompressor
+from utils.database_manager import DatabaseManager
+from utils.json_provider import FastJSONProvider, orjson
+from utils.response_cache import ResponseCache
+
+try:
+    import brotli
+except ImportError:  # Optional dependency
+    brotli = None
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (4, 5, 6, 7, 8, 9)
+
+WORDS = (
+    'join day talks workshops hands-on sessions teams build demo feedback mentors prizes creative projects '
+    'students campus robotics design music sports coding challenge network learn speakers panel lunch '
+    'registration certificate venue online offline hackathon quiz debate photography startup pitch'
+).split()
+
+
+def _text(rng, words):
+    """Varied prose, so compression ratios resemble real descriptions rather than repeated text."""
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def make_app(database_uri):
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=database_uri, COMPRESS_MIN_SIZE=1024, CACHE_BACKEND='memory')
+    app.url_map.strict_slashes = False
+    DatabaseManager.init_app(app)
+    ResponseCache.get_instance().init_app(app)
+    ResponseCompressor.get_instance().init_app(app)
+    app.register_blueprint(event_routes, url_prefix='/api/events')
+    return app
+
+
+def seed(count):
+    organiser = User(clerk_user_id='bench_organiser', name='Organiser', email='organiser@example.com')
+    db.session.add(organiser)
+    db.session.flush()
+    now = datetime.utcnow()
+    rng = random.Random(42)
+    db.session.bulk_insert_mappings(
+        Event,
+        [
+            {
+                'title': f'{_text(rng, 3)[:-1]} {i}',
+                'description': _text(rng, rng.randint(40, 250)),
+                'eligibility': _text(rng, 12),
+                'date': now + timedelta(days=i % 90, hours=i % 24),
+                'deadline': now + timedelta(days=i % 90),
+                'category': ('Tech', 'Art', 'Sports', 'Music')[i % 4],
+                'mode': ('Online', 'Offline')[i % 2],
+                'venue': 'Main Auditorium',
+                'participation_type': ('Individual', 'Team')[i % 2],
+                'organiser_id': organiser.id,
+                'registration_count': i % 50,
+            }
+            for i in range(count)
+        ],
+    )
+    db.session.commit()
+
+
+def timed(repeats, func):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def run_benchmark(events=500, repeats=20):
+    fd, db_file = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+    app = make_app(f'sqlite:///{db_file}')
+    with app.app_context():
+        db.create_all()
+        seed(events)
+        payload = {'events': [row._asdict() for row in _event_listing_query().order_by(Event.id).all()]}
+
+    client = app.test_client()
+    response_cache = ResponseCache.get_instance()
+    encoders = ('stdlib', 'orjson') if orjson is not None else ('stdlib',)
+    results = []
+    try:
+        for encoder in encoders:
+            app.config['JSON_ENCODER'] = encoder
+            app.json = FastJSONProvider(app)
+            with app.app_context():
+                encode_ms = timed(repeats, lambda: app.json.response(payload))
+            for accept in ('identity',) + ResponseCompressor.encodings():
+                headers = {'Accept-Encoding': accept}
+
+                def fresh():
+                    # A new listing generation for every request: nothing is served from the cache
+                    response_cache.invalidate_event()
+                    return client.get('/api/events/', headers=headers)
+
+                size = len(fresh().data)
+                request_ms = timed(repeats, fresh)
+                client.get('/api/events/', headers=headers)  # Stores the body, then its compressed variant
+                client.get('/api/events/', headers=headers)
+                cached_ms = timed(repeats, lambda: client.get('/api/events/', headers=headers))
+                results.append((encoder, accept, encode_ms, size, request_ms, cached_ms))
+        with app.app_context():
+            body = app.json.response(payload).get_data()
+        sweep = [('gzip', level, *_compressed(repeats, lambda: gzip.compress(body, level, mtime=0))) for level in GZIP_LEVELS]
+        if brotli is not None:
+            sweep += [('br', q, *_compressed(repeats, lambda: brotli.compress(body, quality=q))) for q in BROTLI_QUALITIES]
+    finally:
+        with app.app_context():
+            db.session.remove()
+            db.drop_all()
+        os.remove(db_file)
+    return results, len(body), sweep
+
+
+def _compressed(repeats, func):
+    """(bytes, ms) of one compression setting."""
+    return len(func()), timed(repeats, func)
+
+
+if __name__ == '__main__':
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    print('=' * 70)
+    print(f'RESPONSE ENCODING BENCHMARK (list_events, {events} events, {repeats} repeats)')
+    print('=' * 70)
+    results, raw_size, sweep = run_benchmark(events, repeats)
+    print(f'{"encoder":<8} {"encoding":<9} {"encode ms":>10} {"bytes":>10} {"request ms":>11} {"cached ms":>10}')
+    for encoder, encoding, encode_ms, size, request_ms, cached_ms in results:
+        print(f'{encoder:<8} {encoding:<9} {encode_ms:>10.2f} {size:>10} {request_ms:>11.2f} {cached_ms:>10.2f}')
+    # Standard library without compression vs the fastest encoder with the preferred encoding
+    before = results[0]
+    after = next(r for r in results if r[0] == results[-1][0] and r[1] == ResponseCompressor.encodings()[0])
+    print(
+        f'📊 {before[0]}/{before[1]} -> {after[0]}/{after[1]}: encode {before[2]:.2f}ms -> {after[2]:.2f}ms, '
+        f'{before[3]} -> {after[3]} bytes ({after[3] / before[3]:.1%})'
+    )
+    print(f'\nCompression settings on the {raw_size}-byte payload:')
+    print(f'{"encoding":<9} {"level":>6} {"bytes":>10} {"ratio":>7} {"ms":>9}')
+    for encoding, level, size, ms in sweep:
+        print(f'{encoding:<9} {level:>6} {size:>10} {size / raw_size:>7.1%} {ms:>9.2f}')
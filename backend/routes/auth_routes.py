@@ -3,7 +3,7 @@ from datetime import datetime
 from flask import Blueprint, jsonify, make_response, request
 
 from models import User, db
-from utils.clerk_auth import clerk_token_required
+from utils.clerk_auth import UserIdentityCache, clerk_user_required
 
 auth_routes = Blueprint('auth_routes', __name__)
 
@@ -55,6 +55,8 @@ def sync_user():
         db.session.add(user)
 
     db.session.commit()
+    # Drop the cached identity so protected routes see the updated profile
+    UserIdentityCache.get_instance().invalidate(clerk_user_id)
 
     user_data = {
         'id': user.id,
@@ -70,16 +72,11 @@ def sync_user():
 
 # Get current user profile (protected route)
 @auth_routes.route('/me', methods=['GET'])
-@clerk_token_required
-def get_me(clerk_user_id):
+@clerk_user_required
+def get_me(user):
     """
     Get current user profile using Clerk user ID from JWT token.
     """
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
     user_data = {
         'id': user.id,
         'name': user.name,
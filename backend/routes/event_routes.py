@@ -1,17 +1,28 @@
+import base64
+import csv
+import io
+import json
 from datetime import datetime
+from itertools import groupby
 
-from flask import Blueprint, jsonify, make_response, request
+from flask import Blueprint, Response, jsonify, make_response, request, stream_with_context
+from sqlalchemy import and_, case, func, insert, or_, update
+from sqlalchemy.exc import IntegrityError
 
-from models import Event, Registration, RegistrationField, RegistrationFieldResponse, User, db
-from utils.clerk_auth import clerk_token_required
+from models import Event, NotificationBatch, Registration, RegistrationField, RegistrationFieldResponse, User, Waitlist, db
+from utils.clerk_auth import clerk_user_required
+from utils.event_search import apply_search, filter_matches, highlights, search_terms
+from utils.http_cache import conditional, make_etag
 from utils.image_upload_manager import ImageUploadManager
 from utils.participant_notifier import EventNotificationManager
+from utils.response_cache import ResponseCache
 
 event_routes = Blueprint('event_routes', __name__)
 
 # Get singleton instances
 image_manager = ImageUploadManager.get_instance()
 notification_manager = EventNotificationManager.get_instance()
+response_cache = ResponseCache.get_instance()
 
 
 @event_routes.errorhandler(400)
@@ -29,46 +40,434 @@ def not_found(error):
     return make_response(jsonify({'message': str(error), 'status': 404}), 404)
 
 
+LISTING_FILTERS = ('category', 'mode', 'participation_type')
+LISTING_SORTS = ('date_asc', 'date_desc')
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+PARTICIPANT_EXPORT_FORMATS = ('json', 'csv', 'ndjson')
+PARTICIPANT_BATCH_SIZE = 500
+
+
+# Columns list_events can return, by field name
+LISTING_COLUMNS = {
+    'id': Event.id,
+    'title': Event.title,
+    'description': Event.description,
+    'poster_url': Event.poster_url,
+    'date': Event.date,
+    'deadline': Event.deadline,
+    'prizes': Event.prizes,
+    'eligibility': Event.eligibility,
+    'category': Event.category,
+    'mode': Event.mode,
+    'venue': Event.venue,
+    'participation_type': Event.participation_type,
+    'team_size': Event.team_size,
+    'organiser_name': User.name.label('organiser_name'),
+    'organiser_id': Event.organiser_id,
+    'registration_count': Event.registration_count,
+    'max_participants': Event.max_participants,
+}
+# Named projections for `fields=`; summary is what the event cards show (no unbounded TEXT columns)
+LISTING_PROJECTIONS = {
+    'full': tuple(LISTING_COLUMNS),
+    'summary': (
+        'id',
+        'title',
+        'poster_url',
+        'date',
+        'deadline',
+        'category',
+        'mode',
+        'participation_type',
+        'organiser_name',
+        'organiser_id',
+        'registration_count',
+        'max_participants',
+    ),
+}
+MAX_EXCERPT_CHARS = 500
+
+
+def _event_listing_query(fields=LISTING_PROJECTIONS['full'], excerpt=None):
+    """
+    Events as plain result rows with only the given fields; organisers are joined only for organiser_name.
+    excerpt adds `description_excerpt`, the first `excerpt` characters of the description cut in SQL.
+    """
+    columns = [LISTING_COLUMNS[name] for name in fields]
+    if excerpt:
+        columns.append(func.substr(Event.description, 1, excerpt).label('description_excerpt'))
+    query = db.session.query(*columns)
+    if 'organiser_name' in fields:
+        query = query.outerjoin(User, User.id == Event.organiser_id)
+    return query
+
+
+def _parse_listing_fields(args, default):
+    """
+    Field names from `fields` (comma-separated projection or column names, default `default`).
+    id and date are always included: results are identified and paginated by them.
+    """
+    fields = ['id', 'date']
+    for name in (args.get('fields') or default).split(','):
+        name = name.strip()
+        if name in LISTING_PROJECTIONS:
+            fields.extend(LISTING_PROJECTIONS[name])
+        elif name in LISTING_COLUMNS:
+            fields.append(name)
+        else:
+            raise ValueError(f"Unknown field '{name}'. Use a projection ({', '.join(LISTING_PROJECTIONS)}) or column names.")
+    excerpt = args.get('excerpt', type=int)
+    if 'excerpt' in args and (excerpt is None or not 0 < excerpt <= MAX_EXCERPT_CHARS):
+        raise ValueError(f'Invalid excerpt. Use 1-{MAX_EXCERPT_CHARS} characters.')
+    return tuple(dict.fromkeys(fields)), excerpt
+
+
+def _adjust_registration_count(event_id, delta):
+    """
+    Atomic `registration_count = registration_count + delta` in the caller's transaction.
+    updated_at moves too, since the count is part of the event's representation (see _event_validators).
+    """
+    db.session.execute(update(Event).where(Event.id == event_id).values(registration_count=Event.registration_count + delta))
+
+
+def _reserve_seat(event_id):
+    """
+    Conditional `registration_count + 1` that only succeeds while the event has capacity.
+    The UPDATE row-locks just this event until commit, so concurrent sign-ups are serialized
+    without table locks and can never overfill it. Returns False when the event is full.
+    """
+    result = db.session.execute(
+        update(Event)
+        .where(
+            Event.id == event_id,
+            or_(Event.max_participants.is_(None), Event.registration_count < Event.max_participants),
+        )
+        .values(registration_count=Event.registration_count + 1)
+    )
+    return result.rowcount > 0
+
+
+def _parse_max_participants(value):
+    """None/'' for unlimited, else a positive int. Raises ValueError."""
+    if value is None or value == '':
+        return None
+    value = int(value)
+    if value < 1:
+        raise ValueError
+    return value
+
+
+def _validate_responses(event_id, responses):
+    """
+    Check registration answers in memory against the event's field definitions (one query).
+    Returns ({field_id: value}, None), or (None, error message).
+    """
+    fields = {f.id: f for f in RegistrationField.query.filter_by(event_id=event_id)}
+    answers = {}
+    for resp in responses:
+        field_id = resp.get('field_id')
+        if field_id not in fields:
+            return None, f'Invalid field_id: {field_id}.'
+        if resp.get('response_value') is not None:
+            answers[field_id] = resp.get('response_value')
+    for field in fields.values():
+        if field.is_required and not answers.get(field.id):
+            return None, f'Missing required field: {field.field_name}.'
+    return answers, None
+
+
+def _insert_answers(registration_id, answers):
+    """Bulk insert a registration's validated answers."""
+    if answers:
+        db.session.execute(
+            insert(RegistrationFieldResponse),
+            [
+                {'registration_id': registration_id, 'field_id': field_id, 'response_value': value}
+                for field_id, value in answers.items()
+            ],
+        )
+
+
+def _promote_from_waitlist(event_id, requested_by=None):
+    """
+    Move waitlisted users into free places, oldest first, in the caller's transaction.
+    Each step locks the head entry on the (event_id, joined_at, id) index and takes a seat with the same
+    conditional update as register_event, so promotions are serialized with sign-ups on the event row.
+    Queues a notification for the promoted users and returns their ids.
+    """
+    promoted = []
+    while True:
+        # Locking read: a plain SELECT can return a head that a concurrent cancellation already promoted
+        # (REPEATABLE READ snapshot); SKIP LOCKED moves on to the next entry instead of waiting for it
+        head = (
+            Waitlist.query.filter_by(event_id=event_id)
+            .order_by(Waitlist.joined_at, Waitlist.id)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if head is None or not _reserve_seat(event_id):
+            break
+        db.session.delete(head)
+        db.session.flush()
+        registration = Registration(event_id=event_id, user_id=head.user_id)
+        try:
+            with db.session.begin_nested():
+                db.session.add(registration)
+        except IntegrityError:
+            # Registered directly in the meantime: hand the seat back
+            _adjust_registration_count(event_id, -1)
+            continue
+        _insert_answers(registration.id, {r['field_id']: r['response_value'] for r in head.responses or []})
+        promoted.append(head.user_id)
+
+    if promoted:
+        event = db.session.get(Event, event_id)
+        notification_manager.notify_registered_users(
+            event_type='waitlist_promoted',
+            event_data={'event_id': event.id, 'event_title': event.title, 'event_date': event.date.isoformat()},
+            event_id=event_id,
+            requested_by=requested_by,
+            user_ids=promoted,
+        )
+    return promoted
+
+
+def _waitlist_position(entry):
+    """1-based queue position: entries ahead of this one, counted on the (event_id, joined_at, id) index."""
+    ahead = Waitlist.query.filter(
+        Waitlist.event_id == entry.event_id,
+        or_(
+            Waitlist.joined_at < entry.joined_at,
+            and_(Waitlist.joined_at == entry.joined_at, Waitlist.id < entry.id),
+        ),
+    ).count()
+    return ahead + 1
+
+
+def _parse_datetime_arg(args, name):
+    value = args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'Invalid {name}. Use ISO format.')
+
+
+def _apply_listing_filters(query, args):
+    """Narrow the listing query by the category/mode/participation_type and date range arguments."""
+    for name in LISTING_FILTERS:
+        value = args.get(name)
+        if value and value != 'All':
+            query = query.filter(getattr(Event, name) == value)
+
+    date_from = _parse_datetime_arg(args, 'date_from')
+    date_to = _parse_datetime_arg(args, 'date_to')
+    if date_from:
+        query = query.filter(Event.date >= date_from)
+    if date_to:
+        query = query.filter(Event.date <= date_to)
+    return query
+
+
+def _encode_cursor(row):
+    raw = f'{row.date.isoformat()}|{row.id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        date_value, event_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(date_value), int(event_id)
+    except (ValueError, UnicodeError):
+        raise ValueError('Invalid cursor.')
+
+
+def _event_validators(event_id):
+    """
+    (etag, last_modified) for one event from its updated_at and registration count, plus the organiser's
+    last_login: sync_user updates the organiser name and email shown in the payload, and any User update moves it.
+    """
+    row = (
+        db.session.query(Event.updated_at, Event.registration_count, User.last_login)
+        .outerjoin(User, User.id == Event.organiser_id)
+        .filter(Event.id == event_id)
+        .first()
+    )
+    if row is None:
+        return None
+    etag = make_etag('event', event_id, row.updated_at, row.registration_count, row.last_login)
+    return etag, max(filter(None, (row.updated_at, row.last_login)), default=None)
+
+
+def _listing_validators():
+    """
+    (etag, None) for the filtered listing from one aggregate query: validated by ETag only.
+    The row count catches deletions; the registration total catches counter changes; the latest organiser
+    last_login catches organiser name changes (see _event_validators). No Last-Modified: deleting an event
+    moves none of the timestamps left, so If-Modified-Since would keep answering 304 for a deleted event.
+    """
+    try:
+        query = _apply_listing_filters(
+            db.session.query(
+                func.count(Event.id),
+                func.max(Event.updated_at),
+                func.sum(Event.registration_count),
+                func.max(User.last_login),
+            ).outerjoin(User, User.id == Event.organiser_id),
+            request.args,
+        )
+    except ValueError:
+        return None
+    count, updated_at, registrations, organiser_updated_at = query.one()
+    return make_etag('events', count, updated_at, registrations or 0, organiser_updated_at), None
+
+
+def _apply_keyset(query, cursor, descending):
+    """
+    Seek past the (date, id) of the last row already served.
+    Written as an explicit OR rather than a row comparison so MySQL can range-scan the date index.
+    """
+    last_date, last_id = _decode_cursor(cursor)
+    if descending:
+        return query.filter(or_(Event.date < last_date, and_(Event.date == last_date, Event.id < last_id)))
+    return query.filter(or_(Event.date > last_date, and_(Event.date == last_date, Event.id > last_id)))
+
+
 # List all events
 @event_routes.route('/', methods=['GET'])
+@conditional(_listing_validators)
+@response_cache.cached(response_cache.listing_key)
 def list_events():
-    events = Event.query.all()
-    result = []
-    for event in events:
-        organiser = User.query.get(event.organiser_id)
-        registration_count = Registration.query.filter_by(event_id=event.id).count()
-        result.append(
-            {
-                'id': event.id,
-                'title': event.title,
-                'description': event.description,
-                'poster_url': event.poster_url,
-                'date': event.date,
-                'deadline': event.deadline,
-                'prizes': event.prizes,
-                'eligibility': event.eligibility,
-                'category': event.category,
-                'mode': event.mode,
-                'venue': event.venue,
-                'participation_type': event.participation_type,
-                'team_size': event.team_size,
-                'organiser_name': organiser.name if organiser else None,
-                'organiser_id': event.organiser_id,
-                'registration_count': registration_count,
-            }
-        )
-    return jsonify({'events': result}), 200
+    """
+    List events with optional filters (category, mode, participation_type, date_from, date_to)
+    and sort order (date_asc, date_desc).
+    Passing `limit` or `cursor` switches to keyset pagination on (date, id) and adds `next_cursor`
+    to the response; without them the full list is returned as before.
+    `fields` picks the columns returned (see LISTING_PROJECTIONS; paginated requests default to summary,
+    the full list to full) and `excerpt=<chars>` adds a description_excerpt.
+    """
+    args = request.args
+    sort = args.get('sort')
+    if sort and sort not in LISTING_SORTS:
+        return jsonify({'message': f"Invalid sort. Use one of: {', '.join(LISTING_SORTS)}.", 'status': 400}), 400
+    paginated = 'limit' in args or 'cursor' in args
+
+    try:
+        fields, excerpt = _parse_listing_fields(args, 'summary' if paginated else 'full')
+        query = _apply_listing_filters(_event_listing_query(fields, excerpt), args)
+        descending = sort == 'date_desc'
+        if sort or paginated:
+            query = query.order_by(Event.date.desc(), Event.id.desc()) if descending else query.order_by(Event.date, Event.id)
+        else:
+            query = query.order_by(Event.id)
+
+        if not paginated:
+            result = [row._asdict() for row in query.all()]
+            return jsonify({'events': result}), 200
+
+        limit = args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+        if limit is None or limit < 1:
+            raise ValueError('Invalid limit.')
+        limit = min(limit, MAX_PAGE_SIZE)
+        if args.get('cursor'):
+            query = _apply_keyset(query, args['cursor'], descending)
+    except ValueError as e:
+        return jsonify({'message': str(e), 'status': 400}), 400
+
+    # Fetch one extra row to learn whether another page exists
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = _encode_cursor(rows[-1]) if has_more else None
+    return jsonify({'events': [row._asdict() for row in rows], 'next_cursor': next_cursor}), 200
+
+
+# Search events
+@event_routes.route('/search', methods=['GET'])
+def search_events():
+    """
+    Full-text search over title, description and eligibility (`q`), combinable with the listing filters.
+    Results are ranked by relevance and paginated with `limit`/`offset`; instead of the description and
+    eligibility texts each carries a `score` and `highlight` ({'title', 'snippet'} HTML with <mark> tags).
+    """
+    args = request.args
+    if not args.get('q', '').strip():
+        return jsonify({'message': 'Search query (q) is required.', 'status': 400}), 400
+
+    try:
+        limit = args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+        offset = args.get('offset', 0, type=int)
+        if limit is None or limit < 1:
+            raise ValueError('Invalid limit.')
+        if offset is None or offset < 0:
+            raise ValueError('Invalid offset.')
+        limit = min(limit, MAX_PAGE_SIZE)
+        terms = search_terms(args['q'])
+        if not terms:
+            return jsonify({'events': [], 'total': 0, 'next_offset': None}), 200
+        dialect = db.engine.dialect.name
+        query = apply_search(_apply_listing_filters(_event_listing_query(), args), terms, dialect)
+        total_query = filter_matches(_apply_listing_filters(db.session.query(func.count(Event.id)), args), terms, dialect)
+    except ValueError as e:
+        return jsonify({'message': str(e), 'status': 400}), 400
+
+    total = total_query.scalar()
+    events = []
+    for row in query.offset(offset).limit(limit).all():
+        event = row._asdict()
+        for name in ('description', 'eligibility', 'title_highlight', 'snippet'):
+            event.pop(name, None)
+        event['score'] = round(float(row.score), 6)
+        event['highlight'] = highlights(row, terms)
+        events.append(event)
+    next_offset = offset + limit if offset + limit < total else None
+    return jsonify({'events': events, 'total': total, 'next_offset': next_offset}), 200
+
+
+# Facet counts for the listing filters
+@event_routes.route('/facets', methods=['GET'])
+@response_cache.cached(lambda: response_cache.listing_key('facets'))
+def get_event_facets():
+    """
+    Event counts per category, mode and participation_type, plus upcoming/past, for the filter dropdowns.
+    Takes the listing filters (and an optional search `q`). Each facet ignores its own filter, so its
+    counts show what selecting another value would give; upcoming/past applies them all.
+    """
+    args = request.args
+    terms = search_terms(args.get('q'))
+    dialect = db.engine.dialect.name
+
+    def narrow(query, exclude=None):
+        facet_args = args.copy()
+        facet_args.pop(exclude, None)
+        query = _apply_listing_filters(query, facet_args)
+        return filter_matches(query, terms, dialect) if terms else query
+
+    try:
+        facets = {}
+        for name in LISTING_FILTERS:
+            column = getattr(Event, name)
+            query = narrow(db.session.query(column, func.count(Event.id)).filter(column.isnot(None)), exclude=name)
+            rows = query.group_by(column).order_by(func.count(Event.id).desc(), column).all()
+            facets[name] = [{'value': value, 'count': count} for value, count in rows]
+
+        upcoming = func.coalesce(func.sum(case((Event.date >= datetime.utcnow(), 1), else_=0)), 0)
+        total, upcoming_count = narrow(db.session.query(func.count(Event.id), upcoming)).one()
+        upcoming_count = int(upcoming_count)  # MySQL returns SUM() as Decimal
+    except ValueError as e:
+        return jsonify({'message': str(e), 'status': 400}), 400
+
+    facets['when'] = {'upcoming': upcoming_count, 'past': total - upcoming_count}
+    return jsonify({'facets': facets, 'total': total}), 200
 
 
 # Create event
 @event_routes.route('/', methods=['POST'])
-@clerk_token_required
-def create_event(clerk_user_id):
-    # Get user from clerk_user_id
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.', 'status': 404}), 404
-
+@clerk_user_required
+def create_event(user):
     # Handle file upload using ImageUploadManager singleton
     poster_url = None
     if 'poster' in request.files:
@@ -98,10 +497,9 @@ def create_event(clerk_user_id):
     venue = request.form.get('venue')
     participation_type = request.form.get('participation_type')
     team_size = request.form.get('team_size')
+    max_participants = request.form.get('max_participants')
 
     # Parse fields from JSON string
-    import json
-
     fields = []
     if request.form.get('fields'):
         try:
@@ -147,6 +545,11 @@ def create_event(clerk_user_id):
     else:
         team_size = None
 
+    try:
+        max_participants = _parse_max_participants(max_participants)
+    except ValueError:
+        return jsonify({'message': 'Max participants must be a positive number.', 'status': 400}), 400
+
     event = Event(
         title=title,
         description=description,
@@ -160,6 +563,7 @@ def create_event(clerk_user_id):
         venue=venue,
         participation_type=participation_type,
         team_size=team_size,
+        max_participants=max_participants,
         organiser_id=user.id,
     )
     db.session.add(event)
@@ -177,12 +581,15 @@ def create_event(clerk_user_id):
         )
         db.session.add(field_obj)
     db.session.commit()
+    response_cache.invalidate_event(event.id)
 
     return jsonify({'message': 'Event created successfully.', 'event_id': event.id, 'status': 201}), 201
 
 
 # Get event details
 @event_routes.route('/<int:event_id>', methods=['GET'])
+@conditional(_event_validators)
+@response_cache.cached(ResponseCache.event_key)
 def get_event(event_id):
     event = Event.query.get(event_id)
     if not event:
@@ -192,7 +599,6 @@ def get_event(event_id):
     field_defs = [
         {'id': f.id, 'field_name': f.field_name, 'field_type': f.field_type, 'is_required': f.is_required} for f in fields
     ]
-    registration_count = Registration.query.filter_by(event_id=event.id).count()
     event_data = {
         'id': event.id,
         'title': event.title,
@@ -210,7 +616,8 @@ def get_event(event_id):
         'organiser': organiser.name if organiser else None,
         'organiser_email': organiser.email if organiser else None,
         'organiser_id': event.organiser_id,
-        'registration_count': registration_count,
+        'registration_count': event.registration_count,
+        'max_participants': event.max_participants,
         'fields': field_defs,
     }
     return jsonify({'event': event_data}), 200
@@ -218,12 +625,8 @@ def get_event(event_id):
 
 # Update event
 @event_routes.route('/<int:event_id>', methods=['PUT'])
-@clerk_token_required
-def update_event(clerk_user_id, event_id):
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
+@clerk_user_required
+def update_event(user, event_id):
     event = Event.query.get(event_id)
     if not event:
         return jsonify({'message': 'Event not found.'}), 404
@@ -247,6 +650,11 @@ def update_event(clerk_user_id, event_id):
     ]:
         if key in data:
             setattr(event, key, data[key])
+    if 'max_participants' in data:
+        try:
+            event.max_participants = _parse_max_participants(data['max_participants'])
+        except (TypeError, ValueError):
+            return jsonify({'message': 'Max participants must be a positive number.'}), 400
     # Validate date and deadline if updated
     if 'date' in data or 'deadline' in data:
         try:
@@ -261,10 +669,9 @@ def update_event(clerk_user_id, event_id):
             return jsonify({'message': 'Registration deadline must be in the future.'}), 400
         if deadline_date >= event_date:
             return jsonify({'message': 'Registration deadline must be before the event date.'}), 400
-    db.session.commit()
 
-    # Notify registered participants about event update (Observer Pattern)
-    notification_manager.notify_registered_users(
+    # Queue participant notification in the same transaction as the update (Observer Pattern)
+    batch = notification_manager.notify_registered_users(
         event_type='event_updated',
         event_data={
             'event_id': event.id,
@@ -273,121 +680,273 @@ def update_event(clerk_user_id, event_id):
             'updated_fields': list(data.keys()),
         },
         event_id=event_id,
+        requested_by=user.id,
     )
+    if 'max_participants' in data:
+        # Raised capacity goes to the waitlist first (after the snapshot, so they only get the promotion email)
+        _promote_from_waitlist(event_id, requested_by=user.id)
+    db.session.commit()
+    response_cache.invalidate_event(event_id)
 
-    return jsonify({'message': 'Event updated successfully.'}), 200
+    return jsonify({'message': 'Event updated successfully.', 'notification_batch_id': batch.id}), 200
 
 
 # Delete event
 @event_routes.route('/<int:event_id>', methods=['DELETE'])
-@clerk_token_required
-def delete_event(clerk_user_id, event_id):
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
+@clerk_user_required
+def delete_event(user, event_id):
     event = Event.query.get(event_id)
     if not event:
         return jsonify({'message': 'Event not found.'}), 404
     if event.organiser_id != user.id:
         return jsonify({'message': 'Forbidden: Only organiser can delete.'}), 403
 
-    # Notify registered participants before deletion (Observer Pattern)
-    notification_manager.notify_registered_users(
+    # Snapshot participants and queue the cancellation before deletion (Observer Pattern)
+    batch = notification_manager.notify_registered_users(
         event_type='event_cancelled',
         event_data={'event_id': event.id, 'event_title': event.title, 'organiser_name': user.name},
         event_id=event_id,
+        requested_by=user.id,
     )
 
     db.session.delete(event)
     db.session.commit()
-    return jsonify({'message': 'Event deleted successfully.'}), 200
+    response_cache.invalidate_event(event_id)
+    return jsonify({'message': 'Event deleted successfully.', 'notification_batch_id': batch.id}), 200
+
+
+# Get delivery status of a participant notification batch (requesting organiser only)
+@event_routes.route('/notifications/<int:batch_id>', methods=['GET'])
+@clerk_user_required
+def get_notification_status(user, batch_id):
+    batch = NotificationBatch.query.get(batch_id)
+    if not batch:
+        return jsonify({'message': 'Notification batch not found.'}), 404
+    if batch.requested_by != user.id:
+        return jsonify({'message': 'Forbidden'}), 403
+    batch_data = {
+        'id': batch.id,
+        'event_id': batch.event_id,
+        'event_type': batch.event_type,
+        'status': batch.status,
+        'attempts': batch.attempts,
+        'recipient_count': batch.recipient_count,
+        'sent_count': batch.sent_count,
+        'failed_count': batch.failed_count,
+        'last_error': batch.last_error,
+        'next_attempt_at': batch.next_attempt_at,
+        'created_at': batch.created_at,
+        'completed_at': batch.completed_at,
+    }
+    return jsonify({'notification': batch_data}), 200
 
 
 # Register for event
 @event_routes.route('/<int:event_id>/register', methods=['POST'])
-@clerk_token_required
-def register_event(clerk_user_id, event_id):
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
+@clerk_user_required
+def register_event(user, event_id):
     event = Event.query.get(event_id)
     if not event:
         return jsonify({'message': 'Event not found.', 'status': 404}), 404
-    # Prevent duplicate registration
-    if Registration.query.filter_by(event_id=event_id, user_id=user.id).first():
-        return jsonify({'message': 'Already registered for this event.', 'status': 400}), 400
-    data = request.get_json()
+    data = request.get_json(silent=True) or {}
+    answers, error = _validate_responses(event_id, data.get('responses', []))
+    if error:
+        return jsonify({'message': error, 'status': 400}), 400
+
+    # Seat, registration and answers in one transaction; duplicates are rejected by the unique index
+    if not _reserve_seat(event_id):
+        db.session.rollback()
+        # A full event is also what an existing registrant hits; tell them they already have a place
+        if Registration.query.filter_by(event_id=event_id, user_id=user.id).first():
+            return jsonify({'message': 'Already registered for this event.', 'status': 400}), 400
+        return jsonify({'message': 'Event is full. Join the waitlist instead.', 'status': 409}), 409
     registration = Registration(event_id=event_id, user_id=user.id)
     db.session.add(registration)
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'message': 'Already registered for this event.', 'status': 400}), 400
+    _insert_answers(registration.id, answers)
+    if event.max_participants is not None:
+        # Got a place directly (e.g. capacity was raised): leave the waitlist
+        Waitlist.query.filter_by(event_id=event_id, user_id=user.id).delete()
     db.session.commit()
-    # Store custom field responses
-    responses = data.get('responses', [])
-    for resp in responses:
-        field_id = resp.get('field_id')
-        response_value = resp.get('response_value')
-        field = RegistrationField.query.filter_by(id=field_id, event_id=event_id).first()
-        if not field or (field.is_required and not response_value):
-            continue  # skip invalid or missing required field
-        field_response = RegistrationFieldResponse(
-            registration_id=registration.id, field_id=field_id, response_value=response_value
-        )
-        db.session.add(field_response)
-    db.session.commit()
+    response_cache.invalidate_event(event_id)
     return jsonify({'message': 'Registration successful.', 'status': 201}), 201
 
 
 # Cancel registration
 @event_routes.route('/<int:event_id>/register', methods=['DELETE'])
-@clerk_token_required
-def cancel_registration(clerk_user_id, event_id):
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
+@clerk_user_required
+def cancel_registration(user, event_id):
     registration = Registration.query.filter_by(event_id=event_id, user_id=user.id).first()
     if not registration:
         return jsonify({'message': 'Registration not found.'}), 404
+    # Event row first, in the same lock order as register_event
+    _adjust_registration_count(event_id, -1)
     db.session.delete(registration)
+    # The freed place goes to the head of the waitlist in the same transaction
+    _promote_from_waitlist(event_id, requested_by=user.id)
     db.session.commit()
+    response_cache.invalidate_event(event_id)
     return jsonify({'message': 'Registration cancelled.'}), 200
 
 
+# Join the waitlist of a full event
+@event_routes.route('/<int:event_id>/waitlist', methods=['POST'])
+@clerk_user_required
+def join_waitlist(user, event_id):
+    event = Event.query.get(event_id)
+    if not event:
+        return jsonify({'message': 'Event not found.', 'status': 404}), 404
+    if event.max_participants is None or event.registration_count < event.max_participants:
+        return jsonify({'message': 'Event has open places. Register instead.', 'status': 400}), 400
+    if Registration.query.filter_by(event_id=event_id, user_id=user.id).first():
+        return jsonify({'message': 'Already registered for this event.', 'status': 400}), 400
+    data = request.get_json(silent=True) or {}
+    answers, error = _validate_responses(event_id, data.get('responses', []))
+    if error:
+        return jsonify({'message': error, 'status': 400}), 400
+
+    entry = Waitlist(
+        event_id=event_id,
+        user_id=user.id,
+        responses=[{'field_id': field_id, 'response_value': value} for field_id, value in answers.items()],
+    )
+    db.session.add(entry)
+    try:
+        db.session.flush()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'message': 'Already on the waitlist for this event.', 'status': 400}), 400
+    # A place may have freed up since the capacity check
+    promoted = _promote_from_waitlist(event_id)
+    db.session.commit()
+
+    if promoted:
+        # Promotions change registration_count, whoever was promoted
+        response_cache.invalidate_event(event_id)
+    if user.id in promoted:
+        return jsonify({'message': 'A place was available. Registration successful.', 'status': 201}), 201
+    return jsonify({'message': 'Joined the waitlist.', 'position': _waitlist_position(entry), 'status': 201}), 201
+
+
+# Current user's waitlist position
+@event_routes.route('/<int:event_id>/waitlist', methods=['GET'])
+@clerk_user_required
+def get_waitlist_position(user, event_id):
+    entry = Waitlist.query.filter_by(event_id=event_id, user_id=user.id).first()
+    if not entry:
+        return jsonify({'message': 'Not on the waitlist for this event.'}), 404
+    return jsonify({'position': _waitlist_position(entry), 'joined_at': entry.joined_at}), 200
+
+
+# Leave the waitlist
+@event_routes.route('/<int:event_id>/waitlist', methods=['DELETE'])
+@clerk_user_required
+def leave_waitlist(user, event_id):
+    deleted = Waitlist.query.filter_by(event_id=event_id, user_id=user.id).delete()
+    if not deleted:
+        return jsonify({'message': 'Not on the waitlist for this event.'}), 404
+    db.session.commit()
+    return jsonify({'message': 'Left the waitlist.'}), 200
+
+
 # Get participants (organiser only)
 @event_routes.route('/<int:event_id>/participants', methods=['GET'])
-@clerk_token_required
-def get_participants(clerk_user_id, event_id):
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
+@clerk_user_required
+def get_participants(user, event_id):
     event = Event.query.get(event_id)
     if not event:
         return jsonify({'message': 'Event not found.'}), 404
     if event.organiser_id != user.id:
         return jsonify({'message': 'Forbidden: Only organiser can view participants.'}), 403
-    registrations = Registration.query.filter_by(event_id=event_id).all()
-    participants = []
-    for reg in registrations:
-        participant_user = User.query.get(reg.user_id)
-        responses = RegistrationFieldResponse.query.filter_by(registration_id=reg.id).all()
-        custom_fields = [
-            {'field_name': RegistrationField.query.get(r.field_id).field_name, 'response_value': r.response_value}
-            for r in responses
-        ]
-        participants.append({'name': participant_user.name, 'email': participant_user.email, 'fields': custom_fields})
+    export_format = request.args.get('format', 'json')
+    if export_format not in PARTICIPANT_EXPORT_FORMATS:
+        return jsonify({'message': f"Invalid format. Use one of: {', '.join(PARTICIPANT_EXPORT_FORMATS)}."}), 400
+
+    field_names = dict(
+        db.session.query(RegistrationField.id, RegistrationField.field_name)
+        .filter(RegistrationField.event_id == event_id)
+        .order_by(RegistrationField.id)
+        .all()
+    )
+
+    if export_format == 'csv':
+        response = Response(stream_with_context(_participants_csv(event_id, field_names)), mimetype='text/csv')
+        response.headers['Content-Disposition'] = f'attachment; filename=event-{event_id}-participants.csv'
+        return response
+    if export_format == 'ndjson':
+        return Response(stream_with_context(_participants_ndjson(event_id, field_names)), mimetype='application/x-ndjson')
+
+    participants = [
+        _participant_dict(name, email, responses, field_names) for name, email, responses in _iter_participants(event_id)
+    ]
     return jsonify({'participants': participants}), 200
 
 
+def _iter_participants(event_id):
+    """
+    Yield (name, email, [(field_id, response_value), ...]) per registration.
+    One query joins registrations, users and field responses; rows come from a server-side cursor
+    in batches and are grouped by registration, so memory stays flat for any event size.
+    """
+    rows = (
+        db.session.query(
+            Registration.id,
+            User.name,
+            User.email,
+            RegistrationFieldResponse.field_id,
+            RegistrationFieldResponse.response_value,
+        )
+        .join(User, User.id == Registration.user_id)
+        .outerjoin(RegistrationFieldResponse, RegistrationFieldResponse.registration_id == Registration.id)
+        .filter(Registration.event_id == event_id)
+        .order_by(Registration.id, RegistrationFieldResponse.id)
+        .yield_per(PARTICIPANT_BATCH_SIZE)
+    )
+    for _, group in groupby(rows, key=lambda row: row.id):
+        group = list(group)
+        responses = [(row.field_id, row.response_value) for row in group if row.field_id is not None]
+        yield group[0].name, group[0].email, responses
+
+
+def _participant_dict(name, email, responses, field_names):
+    custom_fields = [
+        {'field_name': field_names.get(field_id), 'response_value': response_value} for field_id, response_value in responses
+    ]
+    return {'name': name, 'email': email, 'fields': custom_fields}
+
+
+def _participants_csv(event_id, field_names):
+    """CSV rows with one column per custom field, in field definition order."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return data
+
+    writer.writerow(['name', 'email', *field_names.values()])
+    yield flush()
+    for name, email, responses in _iter_participants(event_id):
+        values = dict(responses)
+        writer.writerow([name, email, *(values.get(field_id, '') for field_id in field_names)])
+        yield flush()
+
+
+def _participants_ndjson(event_id, field_names):
+    for name, email, responses in _iter_participants(event_id):
+        yield json.dumps(_participant_dict(name, email, responses, field_names)) + '\n'
+
+
 # Get user's created events
 @event_routes.route('/users/<int:user_id>/events', methods=['GET'])
-@clerk_token_required
-def get_user_events(clerk_user_id, user_id):
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
+@clerk_user_required
+def get_user_events(user, user_id):
     if user.id != user_id:
         return jsonify({'message': 'Forbidden'}), 403
     events = Event.query.filter_by(organiser_id=user_id).all()
@@ -396,7 +955,7 @@ def get_user_events(clerk_user_id, user_id):
             'id': e.id,
             'title': e.title,
             'date': e.date,
-            'registration_count': Registration.query.filter_by(event_id=e.id).count(),
+            'registration_count': e.registration_count,
         }
         for e in events
     ]
@@ -405,12 +964,8 @@ def get_user_events(clerk_user_id, user_id):
 
 # Get user's registrations
 @event_routes.route('/users/<int:user_id>/registrations', methods=['GET'])
-@clerk_token_required
-def get_user_registrations(clerk_user_id, user_id):
-    user = User.query.filter_by(clerk_user_id=clerk_user_id).first()
-    if not user:
-        return jsonify({'message': 'User not found. Please sync your account.'}), 404
-
+@clerk_user_required
+def get_user_registrations(user, user_id):
     if user.id != user_id:
         return jsonify({'message': 'Forbidden'}), 403
     registrations = Registration.query.filter_by(user_id=user_id).all()
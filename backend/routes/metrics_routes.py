@@ -0,0 +1,68 @@
+import hmac
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from utils.clerk_auth import UserIdentityCache
+from utils.compression import ResponseCompressor
+from utils.database_manager import DatabaseManager
+from utils.request_metrics import RequestMetrics
+from utils.response_cache import ResponseCache
+from utils.token_cache import VerifiedTokenCache
+
+metrics_routes = Blueprint('metrics_routes', __name__)
+# Served at the root (/metrics), where Prometheus scrapes by default
+prometheus_routes = Blueprint('prometheus_routes', __name__)
+
+
+def require_metrics_token():
+    """
+    Metrics reveal routes, timings, statement shapes and pool state, so they are served only when METRICS_TOKEN
+    is set, and only to requests sending it as a bearer token (Prometheus: `authorization` in the scrape config).
+    """
+    expected = current_app.config.get('METRICS_TOKEN')
+    if not expected:
+        return jsonify({'message': 'Metrics are disabled. Set METRICS_TOKEN to enable them.', 'status': 404}), 404
+    supplied = request.headers.get('Authorization') or ''
+    if not hmac.compare_digest(supplied.encode('utf-8'), f'Bearer {expected}'.encode('utf-8')):
+        return jsonify({'message': 'Metrics token is missing or invalid.', 'status': 401}), 401
+    return None
+
+
+metrics_routes.before_request(require_metrics_token)
+prometheus_routes.before_request(require_metrics_token)
+
+
+# Connection pool metrics (connections in use, checkout wait time, churn) per database engine
+@metrics_routes.route('/db', methods=['GET'])
+def get_db_metrics():
+    return jsonify({'pools': DatabaseManager.pool_stats()}), 200
+
+
+# Bytes before/after response compression per encoding
+@metrics_routes.route('/compression', methods=['GET'])
+def get_compression_metrics():
+    return jsonify({'compression': ResponseCompressor.get_instance().stats()}), 200
+
+
+# Cache counters (hit/miss/eviction) for sizing the response, identity and verified-token caches
+@metrics_routes.route('/cache', methods=['GET'])
+def get_cache_metrics():
+    return jsonify(
+        {
+            'cache': ResponseCache.get_instance().stats(),
+            'users': UserIdentityCache.get_instance().stats(),
+            'tokens': VerifiedTokenCache.get_instance().stats(),
+        }
+    ), 200
+
+
+# Latency, SQL statements, response size and slowest query per route
+@metrics_routes.route('/routes', methods=['GET'])
+def get_route_metrics():
+    return jsonify({'routes': RequestMetrics.get_instance().stats()}), 200
+
+
+@prometheus_routes.route('/metrics', methods=['GET'])
+def get_prometheus_metrics():
+    body = RequestMetrics.get_instance().prometheus(pools=DatabaseManager.pool_stats())
+    return Response(body, content_type='text/plain; version=0.0.4; charset=utf-8')
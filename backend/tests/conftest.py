@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures: a throwaway Flask app on in-memory SQLite with the event routes registered.
+
+Usage: python -m pytest tests (from backend/)
+"""
+import os
+import sys
+
+import pytest
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import db  # noqa: E402
+from routes.event_routes import event_routes  # noqa: E402
+from utils.database_manager import DatabaseManager  # noqa: E402
+from utils.response_cache import ResponseCache  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    """App with the response cache off, so every request reaches the database."""
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI='sqlite://', CACHE_BACKEND='none', TESTING=True)
+    app.url_map.strict_slashes = False
+    DatabaseManager.init_app(app)
+    ResponseCache.get_instance().init_app(app)
+    app.register_blueprint(event_routes, url_prefix='/api/events')
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
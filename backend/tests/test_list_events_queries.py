@@ -0,0 +1,77 @@
+"""
+The event listing must run a fixed number of SQL statements however many events it returns:
+one for the conditional-request validators and one for the rows (organisers joined, not loaded per event).
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from models import Event, User, db
+
+LISTING_URLS = (
+    '/api/events/',
+    '/api/events/?fields=summary&category=Tech',
+    '/api/events/?limit=10',
+    '/api/events/?limit=10&sort=date_desc&fields=id,title,organiser_name',
+)
+
+
+def _seed(count, organisers=5):
+    users = User.query.order_by(User.id).all()
+    if not users:
+        users = [
+            User(clerk_user_id=f'organiser_{i}', name=f'Organiser {i}', email=f'organiser{i}@example.com')
+            for i in range(organisers)
+        ]
+        db.session.add_all(users)
+        db.session.flush()
+    start = Event.query.count()
+    now = datetime.utcnow()
+    db.session.bulk_insert_mappings(
+        Event,
+        [
+            {
+                'title': f'Event {i}',
+                'description': 'Description',
+                'date': now + timedelta(days=i % 30, hours=i % 24),
+                'deadline': now + timedelta(days=i % 30),
+                'category': ('Tech', 'Art')[i % 2],
+                'mode': 'Online',
+                'participation_type': 'Individual',
+                'organiser_id': users[i % len(users)].id,
+            }
+            for i in range(start, start + count)
+        ],
+    )
+    db.session.commit()
+
+
+def _count_statements(client, url):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return len(statements), len(response.get_json()['events'])
+
+
+@pytest.mark.parametrize('url', LISTING_URLS)
+def test_listing_statement_count_is_constant(client, url):
+    n = 20
+    _seed(n)
+    small_count, small_rows = _count_statements(client, url)
+
+    _seed(9 * n)
+    large_count, large_rows = _count_statements(client, url)
+
+    if 'limit' not in url:
+        assert large_rows > small_rows
+    assert large_count == small_count, f'{url}: {small_count} statements for {n} events, {large_count} for {10 * n}'
+    assert small_count <= 2
@@ -0,0 +1,63 @@
+"""
+Conditional requests on the event listing: a deleted event must never be hidden behind a 304.
+"""
+from datetime import datetime, timedelta
+
+from werkzeug.http import http_date
+
+from models import Event, User, db
+
+
+def _seed_events(count):
+    organiser = User(clerk_user_id='organiser', name='Organiser', email='organiser@example.com')
+    db.session.add(organiser)
+    db.session.flush()
+    now = datetime.utcnow()
+    events = [
+        Event(
+            title=f'Event {i}',
+            description='Description',
+            date=now + timedelta(days=i + 1),
+            deadline=now + timedelta(days=i),
+            organiser_id=organiser.id,
+        )
+        for i in range(count)
+    ]
+    db.session.add_all(events)
+    db.session.commit()
+    return [event.id for event in events]
+
+
+def test_listing_has_no_last_modified(client):
+    _seed_events(2)
+    response = client.get('/api/events/')
+    assert response.status_code == 200
+    assert response.headers.get('ETag')
+    assert 'Last-Modified' not in response.headers
+
+
+def test_delete_then_if_modified_since_returns_the_listing(client):
+    event_ids = _seed_events(3)
+    first = client.get('/api/events/')
+    assert len(first.get_json()['events']) == 3
+
+    db.session.delete(db.session.get(Event, event_ids[0]))
+    db.session.commit()
+
+    since = http_date(datetime.utcnow() + timedelta(minutes=1))
+    response = client.get('/api/events/', headers={'If-Modified-Since': since})
+    assert response.status_code == 200
+    assert [event['id'] for event in response.get_json()['events']] == event_ids[1:]
+
+
+def test_delete_changes_the_etag(client):
+    event_ids = _seed_events(3)
+    etag = client.get('/api/events/').headers['ETag']
+    assert client.get('/api/events/', headers={'If-None-Match': etag}).status_code == 304
+
+    db.session.delete(db.session.get(Event, event_ids[0]))
+    db.session.commit()
+
+    response = client.get('/api/events/', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert len(response.get_json()['events']) == 2
@@ -0,0 +1,30 @@
+"""
+Metrics endpoints, cache counters included, are only served with METRICS_TOKEN.
+"""
+import pytest
+
+from routes.metrics_routes import metrics_routes
+
+
+@pytest.fixture
+def metrics_client(app):
+    app.config['METRICS_TOKEN'] = 'metrics-secret'
+    app.register_blueprint(metrics_routes, url_prefix='/api/metrics')
+    return app.test_client()
+
+
+def test_cache_stats_are_not_public(metrics_client):
+    assert metrics_client.get('/api/metrics/cache').status_code == 401
+    assert metrics_client.get('/api/metrics/cache', headers={'Authorization': 'Bearer wrong'}).status_code == 401
+    assert metrics_client.get('/api/events/cache/stats').status_code == 404
+
+
+def test_cache_stats_with_token(metrics_client):
+    response = metrics_client.get('/api/metrics/cache', headers={'Authorization': 'Bearer metrics-secret'})
+    assert response.status_code == 200
+    assert set(response.get_json()) == {'cache', 'users', 'tokens'}
+
+
+def test_cache_stats_disabled_without_token(app):
+    app.register_blueprint(metrics_routes, url_prefix='/api/metrics')
+    assert app.test_client().get('/api/metrics/cache').status_code == 404
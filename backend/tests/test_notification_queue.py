@@ -0,0 +1,115 @@
+"""
+Notification outbox: a batch being sent keeps its claim, however long the send takes,
+and a retry only reaches the recipients the failed attempt did not.
+"""
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from flask import Flask
+
+from models import Event, NotificationBatch, NotificationRecipient, Registration, User, db
+from utils.database_manager import DatabaseManager
+from utils.notification_queue import NotificationQueue
+
+
+@pytest.fixture
+def queue_app(tmp_path):
+    """File-backed SQLite, so the lock heartbeat and a second worker get their own connections."""
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=f'sqlite:///{tmp_path / "queue.db"}', NOTIFICATION_WORKER_ENABLED=False)
+    DatabaseManager.init_app(app)
+    with app.app_context():
+        db.create_all()
+        users = [User(clerk_user_id=f'user_{i}', name=f'User {i}', email=f'user{i}@example.com') for i in range(5)]
+        db.session.add_all(users)
+        db.session.flush()
+        now = datetime.utcnow()
+        event = Event(
+            title='Event', description='Description', date=now + timedelta(days=2), deadline=now, organiser_id=users[0].id
+        )
+        db.session.add(event)
+        db.session.flush()
+        db.session.add_all(Registration(event_id=event.id, user_id=user.id) for user in users)
+        db.session.commit()
+        yield app, event.id
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def queue():
+    NotificationQueue.reset_instance()
+    queue = NotificationQueue.get_instance()
+    yield queue
+    NotificationQueue.reset_instance()
+
+
+def test_long_send_is_not_reclaimed(queue_app, queue, monkeypatch):
+    app, event_id = queue_app
+    monkeypatch.setattr(queue, 'LOCK_TIMEOUT_SECONDS', 0.3)
+    monkeypatch.setattr(queue, 'LOCK_REFRESH_SECONDS', 0.05)
+    reclaimed = []
+
+    def slow_dispatch(event_type, event_data, participants):
+        # Another worker polls for longer than the lock timeout while this send is running
+        def other_worker():
+            with app.app_context():
+                for _ in range(8):
+                    time.sleep(0.1)
+                    reclaimed.append(queue._claim_next())
+
+        poller = threading.Thread(target=other_worker)
+        poller.start()
+        poller.join()
+        return {'success': len(participants), 'failed': 0}
+
+    queue.init_app(app, dispatch=slow_dispatch)
+    with app.app_context():
+        batch = queue.enqueue('event_updated', {'event_title': 'Event'}, event_id)
+        db.session.commit()
+        assert queue.process_pending() == 1
+
+        batch = db.session.get(NotificationBatch, batch.id)
+        assert batch.status == 'completed'
+        assert batch.attempts == 1
+    assert reclaimed and not any(reclaimed)
+
+
+def test_retry_skips_recipients_already_sent(queue_app, queue):
+    app, event_id = queue_app
+    attempts = []
+
+    def flaky_dispatch(event_type, event_data, participants):
+        emails = [participant.email for participant in participants]
+        attempts.append((len(participants), emails))
+        for email in emails[:2] if len(attempts) == 1 else emails:
+            participants.mark_sent(email)
+        if len(attempts) == 1:
+            raise RuntimeError('SMTP connection dropped')
+        return {'success': len(emails), 'failed': 0}
+
+    queue.init_app(app, dispatch=flaky_dispatch)
+    with app.app_context():
+        batch = queue.enqueue('event_updated', {'event_title': 'Event'}, event_id)
+        db.session.commit()
+        assert queue.process_pending() == 1
+
+        batch = db.session.get(NotificationBatch, batch.id)
+        assert batch.status == 'pending'
+        assert batch.sent_count == 2
+
+        batch.next_attempt_at = datetime.utcnow()
+        db.session.commit()
+        assert queue.process_pending() == 1
+
+        batch = db.session.get(NotificationBatch, batch.id)
+        assert batch.status == 'completed'
+        assert batch.sent_count == 5
+        first, retry = attempts
+        assert first[0] == 5 and retry[0] == 3
+        assert set(retry[1]).isdisjoint(first[1][:2])
+        assert sorted(first[1][:2] + retry[1]) == sorted(first[1])
+        unsent = NotificationRecipient.query.filter_by(batch_id=batch.id, sent_at=None).count()
+        assert unsent == 0
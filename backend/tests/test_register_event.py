@@ -0,0 +1,59 @@
+"""
+Registration on a full event: an existing registrant is told they are registered, not that it is full.
+"""
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+
+from models import Event, Registration, User, db
+from utils.clerk_auth import UserIdentityCache
+from utils.token_cache import VerifiedTokenCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_auth_caches():
+    UserIdentityCache.reset_instance()
+    VerifiedTokenCache.reset_instance()
+    yield
+    UserIdentityCache.reset_instance()
+    VerifiedTokenCache.reset_instance()
+
+
+def _auth(clerk_user_id):
+    # CLERK_VERIFY_SIGNATURE is off in the test app, so any HS256 token with a sub is accepted
+    return {'Authorization': f"Bearer {jwt.encode({'sub': clerk_user_id}, 'test-signing-key-' * 2, algorithm='HS256')}"}
+
+
+@pytest.fixture
+def full_event():
+    users = [User(clerk_user_id=f'user_{i}', name=f'User {i}', email=f'user{i}@example.com') for i in range(3)]
+    db.session.add_all(users)
+    db.session.flush()
+    now = datetime.utcnow()
+    event = Event(
+        title='Event',
+        description='Description',
+        date=now + timedelta(days=2),
+        deadline=now + timedelta(days=1),
+        organiser_id=users[0].id,
+        max_participants=1,
+        registration_count=1,
+    )
+    db.session.add(event)
+    db.session.flush()
+    db.session.add(Registration(event_id=event.id, user_id=users[1].id))
+    db.session.commit()
+    return event.id
+
+
+def test_registered_user_of_full_event_gets_already_registered(client, full_event):
+    response = client.post(f'/api/events/{full_event}/register', headers=_auth('user_1'), json={})
+    assert response.status_code == 400
+    assert response.get_json()['message'] == 'Already registered for this event.'
+
+
+def test_new_user_of_full_event_gets_event_full(client, full_event):
+    response = client.post(f'/api/events/{full_event}/register', headers=_auth('user_2'), json={})
+    assert response.status_code == 409
+    assert db.session.get(Event, full_event).registration_count == 1
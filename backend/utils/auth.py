@@ -6,6 +6,7 @@ import jwt
 from flask import jsonify, request
 
 from config import Config
+from utils.token_cache import VerifiedTokenCache
 
 
 # Hash a password using bcrypt
@@ -44,7 +45,7 @@ def token_required(f):
         if not auth_header or not auth_header.startswith('Bearer '):
             return jsonify({'message': 'Token is missing!'}), 401
         token = auth_header.split(' ')[1]
-        payload = verify_token(token)
+        payload = VerifiedTokenCache.get_instance().verify(token, verify_token, 'legacy')
         if not payload:
             return jsonify({'message': 'Token is invalid or expired!'}), 401
         current_user_id = payload['user_id']
@@ -1,25 +1,40 @@
+import threading
+from datetime import datetime
 from functools import wraps
+from typing import NamedTuple, Optional
 
 import jwt
-from flask import jsonify, request
+from flask import current_app, g, jsonify, request
+
+from models import User, db
+from utils.jwks_cache import JWKSCache
+from utils.response_cache import InMemoryLRUCache
+from utils.token_cache import VerifiedTokenCache
 
 
 def verify_clerk_session_token(token):
     """
-    Verify Clerk session token using JWT.
-    Clerk uses RS256 algorithm with their public keys.
-    For production, you should fetch and cache Clerk's JWKS.
-    For development, we'll use a simpler approach with the secret key.
+    Verify a Clerk session token.
+    With CLERK_VERIFY_SIGNATURE on, the RS256 signature is checked against Clerk's JWKS (cached in
+    memory by JWKSCache), along with exp/nbf and, if configured, the issuer.
+    With it off (local development only) the token is decoded without any verification.
     """
     try:
-        # Decode the JWT token
-        # Note: In production, use Clerk's JWKS endpoint for verification
-        # https://clerk.com/.well-known/jwks.json
-        payload = jwt.decode(
+        if not current_app.config.get('CLERK_VERIFY_SIGNATURE'):
+            return jwt.decode(token, options={'verify_signature': False})
+
+        kid = jwt.get_unverified_header(token).get('kid')
+        signing_key = JWKSCache.get_instance().get_key(kid)
+        if signing_key is None:
+            return None
+        return jwt.decode(
             token,
-            options={'verify_signature': False},  # For development only
+            signing_key.key,
+            algorithms=['RS256'],
+            issuer=current_app.config.get('CLERK_ISSUER') or None,
+            leeway=current_app.config.get('CLERK_CLOCK_SKEW_SECONDS', 5),
+            options={'require': ['exp', 'sub']},
         )
-        return payload
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
@@ -43,7 +58,7 @@ def clerk_token_required(f):
             return jsonify({'message': 'Authorization token is missing!'}), 401
 
         token = auth_header.split(' ')[1]
-        payload = verify_clerk_session_token(token)
+        payload = VerifiedTokenCache.get_instance().verify(token, verify_clerk_session_token, 'clerk')
 
         if not payload:
             return jsonify({'message': 'Token is invalid or expired!'}), 401
@@ -57,3 +72,110 @@ def clerk_token_required(f):
         return f(clerk_user_id, *args, **kwargs)
 
     return decorated
+
+
+class CurrentUser(NamedTuple):
+    """Snapshot of the local user behind a verified Clerk token, passed to protected views."""
+
+    id: int
+    clerk_user_id: str
+    name: str
+    email: str
+    avatar_url: Optional[str]
+    created_at: Optional[datetime]
+
+
+class UserIdentityCache:
+    """
+    Singleton, bounded TTL cache of clerk_user_id -> CurrentUser.
+    Saves the user lookup on every authenticated request; sync_user invalidates the entry.
+    The cache is per process, so other workers see profile changes within the TTL.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            cls._instance = super(UserIdentityCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize only once."""
+        if not hasattr(self, '_initialized'):
+            self._cache = InMemoryLRUCache(1024)
+            self._ttl = 300
+            self._lock = threading.Lock()
+            self.hits = 0
+            self.misses = 0
+            self._initialized = True
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = UserIdentityCache()
+        return cls._instance
+
+    def init_app(self, app):
+        self._cache = InMemoryLRUCache(app.config.get('AUTH_USER_CACHE_MAX_ENTRIES', 1024))
+        self._ttl = app.config.get('AUTH_USER_CACHE_TTL', 300)
+
+    def resolve(self, clerk_user_id: str) -> Optional[CurrentUser]:
+        """Cached user for a Clerk ID, loading it on a miss. Unknown users are not cached."""
+        user = self._cache.get(clerk_user_id)
+        if user is not None:
+            self._count('hits')
+            return user
+
+        self._count('misses')
+        row = (
+            db.session.query(User.id, User.clerk_user_id, User.name, User.email, User.avatar_url, User.created_at)
+            .filter(User.clerk_user_id == clerk_user_id)
+            .first()
+        )
+        if row is None:
+            return None
+        user = CurrentUser(*row)
+        if self._ttl:
+            self._cache.set(clerk_user_id, user, self._ttl)
+        return user
+
+    def invalidate(self, clerk_user_id: str) -> None:
+        self._cache.delete(clerk_user_id)
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        stats = {'hits': self.hits, 'misses': self.misses, 'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0}
+        stats.update(self._cache.stats())
+        return stats
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        cls._instance = None
+
+
+def clerk_user_required(f):
+    """
+    Decorator to require Clerk authentication and a synced local user.
+    Resolves the user once per request (cached across requests) and passes it to the route as a CurrentUser.
+    """
+
+    @wraps(f)
+    @clerk_token_required
+    def decorated(clerk_user_id, *args, **kwargs):
+        user = g.get('current_user')
+        if user is None or user.clerk_user_id != clerk_user_id:
+            user = UserIdentityCache.get_instance().resolve(clerk_user_id)
+            if user is None:
+                return jsonify({'message': 'User not found. Please sync your account.'}), 404
+            g.current_user = user
+
+        return f(user, *args, **kwargs)
+
+    return decorated
@@ -2,7 +2,101 @@
 Database Manager Singleton
 Ensures single database connection instance throughout the application.
 """
+import random
+import threading
+import time
+
+import jwt
+from flask import g, has_request_context, request
+from flask_migrate import Migrate
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from utils.response_cache import InMemoryLRUCache, RedisCache, ResponseCache
+
+REPLICA_BIND_PREFIX = 'replica_'
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that records how long requests wait for a connection, plus connection churn.
+    Connections in use / idle / overflow come from the pool itself.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.connections_opened = 0
+        self.connections_invalidated = 0
+        event.listen(self, 'connect', self._on_connect)
+        event.listen(self, 'invalidate', self._on_invalidate)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.checkout_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._metrics_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._metrics_lock:
+            self.connections_opened += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._metrics_lock:
+            self.connections_invalidated += 1
+
+    def stats(self):
+        with self._metrics_lock:
+            return {
+                'pool_size': self.size(),
+                'in_use': self.checkedout(),
+                'idle': self.checkedin(),
+                'overflow': max(self.overflow(), 0),
+                'checkouts': self.checkouts,
+                'checkout_timeouts': self.checkout_timeouts,
+                'avg_wait_ms': round(self.wait_seconds_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                'max_wait_ms': round(self.wait_seconds_max * 1000, 3),
+                'connections_opened': self.connections_opened,
+                'connections_invalidated': self.connections_invalidated,
+            }
+
+
+class RoutingSession(Session):
+    """
+    Session that sends SELECTs to a read replica while the current request allows it
+    (GET/HEAD, see DatabaseManager.init_app). Flushes, writes and work outside a request use the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (
+            bind is None
+            and not self._flushing
+            and getattr(clause, 'is_select', False)
+            and has_request_context()
+            and g.get('db_use_replica')
+        ):
+            engine = DatabaseManager.request_replica()
+            if engine is not None:
+                g.db_replica_used = True
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
 
 
 class DatabaseManager:
@@ -13,6 +107,10 @@ class DatabaseManager:
 
     _instance = None
     _db = None
+    _migrate = None
+    _replica_keys = []
+    _recent_writers = InMemoryLRUCache(10000)
+    _sticky_seconds = 5
 
     def __new__(cls):
         """Override __new__ to implement Singleton pattern."""
@@ -23,7 +121,8 @@ class DatabaseManager:
     def __init__(self):
         """Initialize database only once."""
         if DatabaseManager._db is None:
-            DatabaseManager._db = SQLAlchemy()
+            DatabaseManager._db = SQLAlchemy(session_options={'class_': RoutingSession})
+            DatabaseManager._migrate = Migrate()
 
     @classmethod
     def get_db(cls):
@@ -34,14 +133,118 @@ class DatabaseManager:
 
     @classmethod
     def init_app(cls, app):
-        """Initialize database with Flask app."""
+        """
+        Initialize database and Flask-Migrate (`flask db upgrade`) with Flask app.
+        Engine options (pool size, recycle, pre-ping, timeouts) come from SQLALCHEMY_ENGINE_OPTIONS;
+        pooled engines use InstrumentedQueuePool so DatabaseManager.pool_stats() can report on them.
+        SQLALCHEMY_REPLICA_URIS adds read replicas as extra binds, used by GET/HEAD requests.
+        """
         db = cls.get_db()
+        if cls._is_pooled(app.config.get('SQLALCHEMY_DATABASE_URI')):
+            options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+            options.setdefault('poolclass', InstrumentedQueuePool)
+            app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+        replicas = app.config.get('SQLALCHEMY_REPLICA_URIS') or []
+        if replicas:
+            binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+            cls._replica_keys = [f'{REPLICA_BIND_PREFIX}{i}' for i in range(len(replicas))]
+            binds.update(zip(cls._replica_keys, replicas))
+            app.config['SQLALCHEMY_BINDS'] = binds
+            cls._sticky_seconds = app.config.get('DB_REPLICA_STICKY_SECONDS', 5)
+            app.before_request(cls._route_request)
+            app.after_request(cls._remember_write)
+            print(f'✅ Read replicas enabled ({len(replicas)})')
+
         db.init_app(app)
+        cls._migrate.init_app(app, db)
         return db
 
+    # Read replica routing
+
+    @staticmethod
+    def _writer_key():
+        """
+        Who a write marker belongs to: the Clerk user id (a protected view's verified user, or before the view
+        runs the token's claim; it only picks the database, never grants access), else the client address.
+        """
+        user = g.get('current_user')
+        if user is not None:
+            return f'writer:user:{user.clerk_user_id}'
+        auth_header = request.headers.get('Authorization') or ''
+        if auth_header.startswith('Bearer '):
+            try:
+                clerk_user_id = jwt.decode(auth_header[7:], options={'verify_signature': False}).get('sub')
+            except jwt.InvalidTokenError:
+                clerk_user_id = None
+            if clerk_user_id:
+                return f'writer:user:{clerk_user_id}'
+        return f'writer:addr:{request.remote_addr or ""}'
+
+    @classmethod
+    def _write_markers(cls):
+        """
+        Redis when the response cache uses it, so a write is seen by every worker process and server; otherwise
+        this process's own LRU (kept apart from the in-memory response cache so markers don't evict bodies).
+        """
+        backend = ResponseCache.get_instance().backend
+        return backend if isinstance(backend, RedisCache) else cls._recent_writers
+
+    @classmethod
+    def _route_request(cls):
+        """
+        Reads may go to a replica for GET/HEAD, except for users who wrote within the last
+        DB_REPLICA_STICKY_SECONDS: they stay on the primary so they read their own writes.
+        """
+        g.db_use_replica = request.method in ('GET', 'HEAD') and cls._write_markers().get(cls._writer_key()) is None
+
+    @classmethod
+    def _remember_write(cls, response):
+        if request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+            cls._write_markers().set(cls._writer_key(), b'1', cls._sticky_seconds)
+        return response
+
+    @classmethod
+    def choose_replica(cls):
+        """A replica engine, or None when no replicas are configured."""
+        if not cls._replica_keys:
+            return None
+        return cls.get_db().engines[random.choice(cls._replica_keys)]
+
+    @classmethod
+    def request_replica(cls):
+        """
+        The replica serving the current request, chosen on its first read and kept on flask.g, so the validators,
+        counts and rows of one response come from one replica (one replication lag, one pooled connection).
+        """
+        if 'db_replica' not in g:
+            g.db_replica = cls.choose_replica()
+        return g.db_replica
+
+    @staticmethod
+    def _is_pooled(uri):
+        # In-memory SQLite needs its single shared connection, not a queue pool
+        if not uri:
+            return False
+        url = make_url(uri)
+        return not (url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:'))
+
+    @classmethod
+    def pool_stats(cls):
+        """Connection pool metrics per engine (call inside an app context)."""
+        stats = {}
+        for bind_key, engine in cls.get_db().engines.items():
+            pool = engine.pool
+            name = bind_key or 'default'
+            stats[name] = pool.stats() if isinstance(pool, InstrumentedQueuePool) else {'status': pool.status()}
+        return stats
+
     @classmethod
     def create_all(cls, app):
-        """Create all database tables."""
+        """
+        Create all database tables.
+        Only creates missing tables; schema changes to existing tables ship as migrations in migrations/.
+        """
         db = cls.get_db()
         with app.app_context():
             db.create_all()
@@ -51,3 +254,6 @@ class DatabaseManager:
         """Reset singleton instance (useful for testing)."""
         cls._instance = None
         cls._db = None
+        cls._migrate = None
+        cls._replica_keys = []
+        cls._recent_writers = InMemoryLRUCache(10000)
@@ -0,0 +1,219 @@
+"""
+Email Dispatch Engine
+Fans bulk email out across a pool of SMTP worker threads, each holding its own
+persistent connection, under a global token-bucket rate limit.
+"""
+import queue
+import random
+import smtplib
+import threading
+import time
+from typing import Callable, Iterable, Optional, Tuple
+
+from flask_mail import Connection, Message
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by all workers.
+    A rate of 0 disables limiting.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        self.rate = rate_per_second
+        self.capacity = max(capacity, 1)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one token is available."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class _TimedConnection(Connection):
+    """Flask-Mail connection whose socket has a connect/IO timeout (Flask-Mail opens it without one)."""
+
+    def __init__(self, mail, timeout: float):
+        super().__init__(mail)
+        self.timeout = timeout
+
+    def configure_host(self):
+        smtp_class = smtplib.SMTP_SSL if self.mail.use_ssl else smtplib.SMTP
+        host = smtp_class(self.mail.server, self.mail.port, timeout=self.timeout)
+        host.set_debuglevel(int(self.mail.debug))
+        if self.mail.use_tls:
+            host.starttls()
+        if self.mail.username and self.mail.password:
+            host.login(self.mail.username, self.mail.password)
+        return host
+
+
+class SMTPSession:
+    """
+    One worker's persistent Flask-Mail connection, opened lazily and recycled every N messages.
+    A stalled server raises socket.timeout (an OSError) after `timeout` seconds instead of blocking the worker.
+    """
+
+    def __init__(self, mail, max_per_connection: int, timeout: float = 30):
+        self._mail = mail
+        self._max_per_connection = max_per_connection
+        self._timeout = timeout
+        self._connection = None
+        self._sent = 0
+
+    def send(self, msg: Message) -> None:
+        if self._connection is None or self._sent >= self._max_per_connection:
+            self.close()
+            # Mail.connect() resolves the current app's Flask-Mail state; reopen it with a timeout
+            connection = _TimedConnection(self._mail.connect().mail, self._timeout)
+            connection.__enter__()
+            self._connection = connection
+            self._sent = 0
+        self._connection.send(msg)
+        self._sent += 1
+
+    def close(self) -> None:
+        """Quit the session; a connection that already broke is simply dropped."""
+        if self._connection is None:
+            return
+        try:
+            self._connection.__exit__(None, None, None)
+        except (OSError, smtplib.SMTPException):
+            pass
+        self._connection = None
+
+
+class EmailDispatcher:
+    """
+    Parallel, rate-limited SMTP sender used by EmailService for bulk sends.
+    Messages are consumed lazily through a bounded queue, so a generator of any size
+    can be dispatched without materializing it.
+    """
+
+    QUEUE_SIZE_PER_WORKER = 50
+
+    def __init__(
+        self,
+        mail,
+        app,
+        workers: int = 4,
+        rate_limit_per_minute: float = 0,
+        max_per_connection: int = 100,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        timeout: float = 30,
+    ):
+        self._mail = mail
+        self._app = app
+        self.workers = max(workers, 1)
+        self.max_per_connection = max_per_connection
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        # Burst of one second's worth of tokens (at least one per worker)
+        rate_per_second = rate_limit_per_minute / 60
+        self._bucket = TokenBucket(rate_per_second, max(rate_per_second, self.workers))
+
+    def dispatch(
+        self, messages: Iterable[Tuple[str, str, str, Optional[str]]], on_sent: Optional[Callable[[str], None]] = None
+    ) -> dict:
+        """
+        Send (recipient, subject, body, html) tuples across the worker pool.
+        on_sent(recipient) is called from the worker threads after each successful delivery.
+
+        Returns:
+            Dictionary with success/failed/retried counts, worker count, elapsed seconds and messages per second
+        """
+        started = time.perf_counter()
+        stats = {'success': 0, 'failed': 0, 'retried': 0}
+        stats_lock = threading.Lock()
+        jobs = queue.Queue(maxsize=self.workers * self.QUEUE_SIZE_PER_WORKER)
+
+        threads = [
+            threading.Thread(
+                target=self._worker, args=(jobs, stats, stats_lock, on_sent), name=f'email-worker-{i}', daemon=True
+            )
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for message in messages:
+                jobs.put(message)
+        finally:
+            # Workers always get their stop signal, even if the producer raised
+            for _ in threads:
+                jobs.put(None)
+            for thread in threads:
+                thread.join()
+
+        elapsed = time.perf_counter() - started
+        total = stats['success'] + stats['failed']
+        stats['workers'] = self.workers
+        stats['elapsed_seconds'] = round(elapsed, 3)
+        stats['messages_per_second'] = round(total / elapsed, 2) if elapsed > 0 else float(total)
+        return stats
+
+    def _worker(self, jobs, stats, stats_lock, on_sent) -> None:
+        with self._app.app_context():
+            session = SMTPSession(self._mail, self.max_per_connection, self.timeout)
+            try:
+                while True:
+                    job = jobs.get()
+                    if job is None:
+                        return
+                    outcome, retries = self._deliver(session, job)
+                    with stats_lock:
+                        stats[outcome] += 1
+                        stats['retried'] += retries
+                    if outcome == 'success' and on_sent is not None:
+                        on_sent(job[0])
+            finally:
+                session.close()
+
+    def _deliver(self, session: SMTPSession, job) -> Tuple[str, int]:
+        """Send one message, retrying transient failures with exponential backoff and jitter."""
+        recipient, subject, body, html = job
+        msg = Message(subject=subject, recipients=[recipient], body=body, html=html)
+
+        for attempt in range(self.max_retries + 1):
+            self._bucket.acquire()
+            try:
+                session.send(msg)
+                return 'success', attempt
+            except smtplib.SMTPRecipientsRefused as e:
+                print(f'❌ Failed to send email to {recipient}: {str(e)}')
+                return 'failed', attempt
+            except smtplib.SMTPResponseException as e:
+                # 5xx is permanent; 4xx (e.g. 421 rate limited) is worth retrying on a fresh session
+                if e.smtp_code >= 500:
+                    print(f'❌ Failed to send email to {recipient}: {str(e)}')
+                    return 'failed', attempt
+                session.close()
+                error = e
+            except OSError as e:
+                # Dropped or broken session
+                session.close()
+                error = e
+            except Exception as e:
+                # Malformed message (bad headers, missing sender): retrying cannot help
+                print(f'❌ Failed to send email to {recipient}: {str(e)}')
+                return 'failed', attempt
+
+            if attempt < self.max_retries:
+                time.sleep(self.backoff_seconds * 2**attempt * random.uniform(0.5, 1.5))
+
+        print(f'❌ Failed to send email to {recipient} after {self.max_retries + 1} attempts: {str(error)}')
+        return 'failed', self.max_retries
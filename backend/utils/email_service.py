@@ -2,9 +2,14 @@
 Email Service Singleton
 Handles all email sending operations using Flask-Mail.
 """
+import time
+from typing import Callable, Iterable, Optional, Tuple
+
 from flask_mail import Mail, Message
 
 from config import Config
+from utils.email_dispatcher import EmailDispatcher
+from utils.email_templates import PreparedEmail
 
 
 class EmailService:
@@ -15,6 +20,7 @@ class EmailService:
     _instance = None
     _mail = None
     _app = None
+    _dispatcher = None
 
     def __new__(cls):
         """Singleton pattern implementation."""
@@ -49,6 +55,17 @@ class EmailService:
             print('✅ Email service initialized successfully')
             self._email_configured = True
 
+        self._dispatcher = EmailDispatcher(
+            self._mail,
+            app,
+            workers=config.MAIL_DISPATCH_WORKERS,
+            rate_limit_per_minute=config.MAIL_RATE_LIMIT_PER_MINUTE,
+            max_per_connection=config.MAIL_MAX_MESSAGES_PER_CONNECTION,
+            max_retries=config.MAIL_SEND_RETRIES,
+            backoff_seconds=config.MAIL_RETRY_BACKOFF_SECONDS,
+            timeout=config.MAIL_TIMEOUT,
+        )
+
         return self._mail
 
     def send_email(self, recipient: str, subject: str, body: str, html: str = None) -> bool:
@@ -85,9 +102,51 @@ class EmailService:
             print(f'❌ Failed to send email to {recipient}: {str(e)}')
             return False
 
+    def send_messages(
+        self, messages: Iterable[Tuple[str, str, str, Optional[str]]], on_sent: Optional[Callable[[str], None]] = None
+    ) -> dict:
+        """
+        Send many emails through the dispatch engine.
+
+        Messages are spread over MAIL_DISPATCH_WORKERS threads, each reusing one SMTP session
+        (recycled every MAIL_MAX_MESSAGES_PER_CONNECTION messages), under a global
+        MAIL_RATE_LIMIT_PER_MINUTE limit, with per-message retry and backoff.
+
+        Args:
+            messages: Iterable of (recipient, subject, body, html) tuples; may be a generator
+            on_sent: Optional callable(recipient) run after each successful delivery (possibly from a worker thread)
+
+        Returns:
+            Dictionary with success/failure/retry counts, elapsed seconds and messages per second
+        """
+        if not self._email_configured:
+            started = time.perf_counter()
+            success = 0
+            for recipient, subject, body, html in messages:
+                self.send_email(recipient, subject, body, html)
+                success += 1
+                if on_sent is not None:
+                    on_sent(recipient)
+            elapsed = time.perf_counter() - started
+            return {
+                'success': success,
+                'failed': 0,
+                'retried': 0,
+                'workers': 1,
+                'elapsed_seconds': round(elapsed, 3),
+                'messages_per_second': round(success / elapsed, 2) if elapsed > 0 else float(success),
+            }
+
+        stats = self._dispatcher.dispatch(messages, on_sent)
+        print(
+            f"✅ Bulk send finished: {stats['success']} sent, {stats['failed']} failed, {stats['retried']} retries "
+            f"({stats['messages_per_second']} msg/s on {stats['workers']} workers)"
+        )
+        return stats
+
     def send_bulk_email(self, recipients: list, subject: str, body_template: str, html_template: str = None) -> dict:
         """
-        Send emails to multiple recipients.
+        Send emails to multiple recipients through the dispatch engine.
 
         Args:
             recipients: List of tuples (email, name, custom_data)
@@ -96,25 +155,19 @@ class EmailService:
             html_template: Optional HTML template
 
         Returns:
-            Dictionary with success/failure counts
+            Dictionary with success/failure counts and throughput
         """
-        success = 0
-        failed = 0
+        # Split the templates around {name} once; each recipient is then a join, with the name escaped in HTML
+        prepared = PreparedEmail.from_strings(subject, body_template, html_template)
 
-        for recipient_info in recipients:
-            email = recipient_info[0]
-            name = recipient_info[1] if len(recipient_info) > 1 else 'User'
-
-            # Replace placeholders
-            body = body_template.replace('{name}', name)
-            html = html_template.replace('{name}', name) if html_template else None
-
-            if self.send_email(email, subject, body, html):
-                success += 1
-            else:
-                failed += 1
+        def messages():
+            for recipient_info in recipients:
+                email = recipient_info[0]
+                name = recipient_info[1] if len(recipient_info) > 1 else 'User'
+                _, body, html = prepared.render(name)
+                yield email, subject, body, html
 
-        return {'success': success, 'failed': failed}
+        return self.send_messages(messages())
 
     @classmethod
     def reset_instance(cls):
@@ -122,3 +175,4 @@ class EmailService:
         cls._instance = None
         cls._mail = None
         cls._app = None
+        cls._dispatcher = None
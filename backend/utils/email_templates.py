@@ -0,0 +1,102 @@
+"""
+Email Template Renderer Singleton
+Jinja2 email templates compiled once per notification type. Event-level content is rendered
+once per batch; only the recipient name is substituted per message.
+"""
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from markupsafe import Markup, escape
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates', 'emails')
+
+# Rendered in place of the recipient name, then split on to leave the per-recipient slots
+_NAME_SLOT = '\x00recipient_name\x00'
+
+
+class PreparedEmail:
+    """
+    A notification rendered once for a whole batch, split around the recipient name.
+    render() is a string join, so personalizing thousands of messages costs almost nothing.
+    """
+
+    def __init__(self, subject: str, text_parts: List[str], html_parts: Optional[List[str]]):
+        self.subject = subject
+        self._text_parts = text_parts
+        self._html_parts = html_parts
+
+    @classmethod
+    def from_strings(cls, subject: str, body_template: str, html_template: str = None, placeholder: str = '{name}'):
+        """Prepare plain string templates that use a literal placeholder (e.g. '{name}') for the name."""
+        html_parts = html_template.split(placeholder) if html_template else None
+        return cls(subject, body_template.split(placeholder), html_parts)
+
+    def render(self, name: str) -> Tuple[str, str, Optional[str]]:
+        """Return (subject, body, html) for one recipient. The name is HTML-escaped in the HTML part."""
+        body = name.join(self._text_parts)
+        html = str(escape(name)).join(self._html_parts) if self._html_parts is not None else None
+        return self.subject, body, html
+
+
+class EmailTemplateRenderer:
+    """
+    Singleton renderer for notification emails.
+    Templates live in templates/emails/<type>.subject.txt, <type>.txt and <type>.html.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            cls._instance = super(EmailTemplateRenderer, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize only once."""
+        if not hasattr(self, '_initialized'):
+            self._env = Environment(
+                loader=FileSystemLoader(TEMPLATE_DIR),
+                autoescape=select_autoescape(['html']),
+            )
+            self._templates = {}
+            self._initialized = True
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = EmailTemplateRenderer()
+        return cls._instance
+
+    def _compiled(self, notification_type: str):
+        """(subject, text, html) templates for a type, compiled on first use."""
+        if notification_type not in self._templates:
+            self._templates[notification_type] = (
+                self._env.get_template(f'{notification_type}.subject.txt'),
+                self._env.get_template(f'{notification_type}.txt'),
+                self._env.get_template(f'{notification_type}.html'),
+            )
+        return self._templates[notification_type]
+
+    def prepare(self, notification_type: str, context: Dict[str, Any]) -> PreparedEmail:
+        """Render the event-level parts of a notification once for a batch."""
+        subject_template, text_template, html_template = self._compiled(notification_type)
+        # Markup keeps the slot marker from being escaped; the real name is escaped in render()
+        slot_context = dict(context, name=Markup(_NAME_SLOT))
+        return PreparedEmail(
+            subject_template.render(context),
+            text_template.render(slot_context).split(_NAME_SLOT),
+            html_template.render(slot_context).split(_NAME_SLOT),
+        )
+
+    def render(self, notification_type: str, context: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Fully render one message (no batch reuse); used as the baseline in template_benchmark.py."""
+        subject_template, text_template, html_template = self._compiled(notification_type)
+        return subject_template.render(context), text_template.render(context), html_template.render(context)
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        cls._instance = None
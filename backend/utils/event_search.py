@@ -0,0 +1,90 @@
+"""
+Event Search
+Ranked full-text search over event title, description and eligibility.
+MySQL matches against the ft_event_text FULLTEXT index; SQLite (local runs) against the event_fts
+FTS5 table (see models.py). Both return highlighted titles and snippets, HTML-escaped with <mark> tags.
+"""
+import html
+import re
+
+from sqlalchemy import column, desc, func, literal_column, table
+from sqlalchemy.dialects.mysql import match
+
+from models import Event
+
+MAX_TERMS = 8
+SNIPPET_CHARS = 160
+SNIPPET_TOKENS = 24
+
+# Highlight markers that cannot occur in HTML-escaped text; swapped for <mark> after escaping
+_START, _END = '\x02', '\x03'
+_ELLIPSIS = '…'
+_TERM_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+_event_fts = table('event_fts', column('rowid'))
+_fts = literal_column('event_fts')
+
+
+def search_terms(q):
+    """Words of the query string; operators and punctuation are dropped so user input can't break the match syntax."""
+    return _TERM_PATTERN.findall(q or '')[:MAX_TERMS]
+
+
+def _relevance(terms):
+    """MySQL MATCH ... AGAINST in boolean mode: every term required, as a word prefix."""
+    expression = ' '.join(f'+{term}*' for term in terms)
+    return match(Event.title, Event.description, Event.eligibility, against=expression).in_boolean_mode()
+
+
+def filter_matches(query, terms, dialect):
+    """Restrict an Event query to rows matching every term (as a word prefix, so partial words match while typing)."""
+    if dialect == 'sqlite':
+        expression = ' '.join(f'"{term}"*' for term in terms)
+        return query.join(_event_fts, _event_fts.c.rowid == Event.id).filter(_fts.op('MATCH')(expression))
+    return query.filter(_relevance(terms))
+
+
+def apply_search(query, terms, dialect):
+    """filter_matches, ordered by relevance, with `score`, `title_highlight` and `snippet` columns added."""
+    query = filter_matches(query, terms, dialect)
+    if dialect == 'sqlite':
+        # bm25 is lower-is-better; title matches weigh most, then eligibility, then description
+        rank = func.bm25(_fts, 10.0, 1.0, 2.0)
+        return query.add_columns(
+            (-rank).label('score'),
+            func.highlight(_fts, 0, _START, _END).label('title_highlight'),
+            func.snippet(_fts, -1, _START, _END, _ELLIPSIS, SNIPPET_TOKENS).label('snippet'),
+        ).order_by(rank, Event.id)
+    return query.add_columns(_relevance(terms).label('score')).order_by(desc('score'), Event.id)
+
+
+def _mark(text, pattern):
+    return pattern.sub(lambda m: f'{_START}{m.group(0)}{_END}', text)
+
+
+def _excerpt(texts, pattern):
+    """Window of SNIPPET_CHARS around the first match in the first matching text (MySQL has no snippet function)."""
+    for text in texts:
+        found = pattern.search(text or '')
+        if found:
+            start = max(found.start() - SNIPPET_CHARS // 3, 0)
+            end = start + SNIPPET_CHARS
+            excerpt = _mark(text[start:end], pattern)
+            return f'{_ELLIPSIS if start else ""}{excerpt}{_ELLIPSIS if end < len(text) else ""}'
+    text = next((text for text in texts if text), '')
+    return text[:SNIPPET_CHARS] + (_ELLIPSIS if len(text) > SNIPPET_CHARS else '')
+
+
+def to_html(marked):
+    """Escape marked-up text for display, turning the highlight markers into <mark> tags."""
+    return html.escape(marked or '').replace(_START, '<mark>').replace(_END, '</mark>')
+
+
+def highlights(row, terms):
+    """{'title', 'snippet'} HTML for a result row of apply_search."""
+    title, snippet = getattr(row, 'title_highlight', None), getattr(row, 'snippet', None)
+    if title is None:
+        pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, terms)) + r')\w*', re.IGNORECASE | re.UNICODE)
+        title = _mark(row.title, pattern)
+        snippet = _excerpt((row.description, row.eligibility), pattern)
+    return {'title': to_html(title), 'snippet': to_html(snippet)}
@@ -0,0 +1,54 @@
+"""
+HTTP conditional requests
+ETag / Last-Modified validators with 304 Not Modified responses, checked before the view runs.
+"""
+import hashlib
+from functools import wraps
+
+from flask import current_app, g, make_response, request
+from werkzeug.http import is_resource_modified
+
+
+def make_etag(*parts) -> str:
+    """Opaque tag from the values that determine a representation."""
+    return hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+
+def conditional(validator):
+    """
+    Decorator for GET views: answer If-None-Match / If-Modified-Since with 304 when the resource is unchanged.
+
+    validator receives the view's keyword arguments and returns (etag, last_modified), or None to skip
+    the check (e.g. the resource does not exist; the view then produces its own error). It should be a
+    cheap query: on a match the view and its payload are never built. The tag is left on g.http_etag for the
+    response cache, which only serves a body stored under the same tag (see ResponseCache.cached).
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            validators = validator(**kwargs)
+            if validators is None:
+                return f(*args, **kwargs)
+
+            etag, last_modified = validators
+            if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+                response = current_app.response_class(status=304)
+            else:
+                g.http_etag = etag
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            # Weak: the same representation may be sent compressed or not
+            response.set_etag(etag, weak=True)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.cache_control.public = True
+            response.cache_control.max_age = current_app.config.get('HTTP_CACHE_MAX_AGE', 0)
+            response.cache_control.must_revalidate = True
+            return response
+
+        return decorated
+
+    return decorator
@@ -0,0 +1,61 @@
+"""
+JSON Provider
+Flask JSON provider that encodes responses with orjson when it is installed (optional `pip install orjson`)
+and with the standard library otherwise. Both write datetimes as ISO 8601 in UTC (naive values are UTC),
+so clients see the same payload whichever encoder is active.
+"""
+from datetime import date, datetime, timezone
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+def _isoformat(value):
+    if isinstance(value, datetime) and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON_ENCODER picks the encoder: 'auto' (orjson if installed), 'orjson' or 'stdlib'.
+    Parsing request bodies is left to the standard library.
+    """
+
+    def __init__(self, app):
+        super().__init__(app)
+        encoder = app.config.get('JSON_ENCODER', 'auto')
+        if encoder == 'orjson' and orjson is None:
+            raise RuntimeError('JSON_ENCODER=orjson needs the orjson package (pip install orjson)')
+        self.encoder = 'orjson' if orjson is not None and encoder != 'stdlib' else 'stdlib'
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (date, datetime)):
+            return _isoformat(o)
+        return DefaultJSONProvider.default(o)
+
+    def _orjson_options(self, pretty=False):
+        options = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if pretty:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj, **kwargs):
+        if self.encoder == 'orjson' and not kwargs:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_options()).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if self.encoder != 'orjson':
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=self.default, option=self._orjson_options(pretty))
+        return self._app.response_class(body + b'\n', mimetype=self.mimetype)
@@ -0,0 +1,154 @@
+"""
+JWKS Cache Singleton
+Clerk's token signing keys, fetched once and held in memory by `kid`.
+A background thread refreshes the set before it goes stale; an unknown `kid` (key rotation)
+forces a refresh, shared by all concurrent requests (single flight).
+"""
+import json
+import threading
+import time
+from typing import Dict, Optional
+
+import jwt
+import requests
+
+
+class JWKSCache:
+    """
+    Singleton in-memory key set.
+    The source is an http(s) JWKS URL or, for local development and tests, a JWKS file path.
+    """
+
+    _instance = None
+
+    REFRESH_AHEAD_RATIO = 0.8  # Background refresh at 80% of the TTL
+    RETRY_SECONDS = 30  # After a failed fetch, and minimum gap between forced refreshes
+    FETCH_TIMEOUT_SECONDS = 5
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            cls._instance = super(JWKSCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize only once."""
+        if not hasattr(self, '_initialized'):
+            self._source = None
+            self._ttl = 3600
+            self._keys: Dict[str, jwt.PyJWK] = {}
+            self._expires_at = 0.0
+            self._generation = 0
+            self._last_forced = 0.0
+            self._refresh_lock = threading.Lock()
+            self._refresher = None
+            self._stop = threading.Event()
+            self.fetches = 0
+            self.failures = 0
+            self._initialized = True
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = JWKSCache()
+        return cls._instance
+
+    def init_app(self, app):
+        """Configure from CLERK_JWKS_URL / CLERK_JWKS_TTL; start refreshing when verification is on."""
+        self._source = app.config.get('CLERK_JWKS_URL')
+        self._ttl = app.config.get('CLERK_JWKS_TTL', 3600)
+        if app.config.get('CLERK_VERIFY_SIGNATURE') and self._source:
+            self.refresh()
+            self.start_refresher()
+            print(f'✅ Clerk JWKS loaded ({len(self._keys)} keys)')
+        elif app.config.get('CLERK_VERIFY_SIGNATURE'):
+            print('⚠️ CLERK_VERIFY_SIGNATURE is on but CLERK_JWKS_URL is not set; all tokens will be rejected')
+
+    def _fetch(self) -> dict:
+        if self._source.startswith(('http://', 'https://')):
+            response = requests.get(self._source, timeout=self.FETCH_TIMEOUT_SECONDS)
+            response.raise_for_status()
+            return response.json()
+        path = self._source[len('file://') :] if self._source.startswith('file://') else self._source
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def refresh(self) -> bool:
+        """
+        Fetch the key set. Callers that arrive while a fetch is in flight wait for it and reuse
+        its result instead of fetching again. On failure the previous keys stay in use.
+        """
+        generation = self._generation
+        with self._refresh_lock:
+            if self._generation != generation:
+                return True
+            return self._load()
+
+    def _load(self) -> bool:
+        # Called with _refresh_lock held
+        try:
+            data = self._fetch()
+            keys = {jwk['kid']: jwt.PyJWK(jwk) for jwk in data.get('keys', []) if jwk.get('use', 'sig') == 'sig'}
+        except Exception as e:
+            self.failures += 1
+            self._expires_at = time.monotonic() + self.RETRY_SECONDS
+            print(f'⚠️ JWKS refresh failed: {str(e)}')
+            return False
+
+        self._keys = keys
+        self._expires_at = time.monotonic() + self._ttl
+        self._generation += 1
+        self.fetches += 1
+        return True
+
+    def get_key(self, kid: str) -> Optional[jwt.PyJWK]:
+        """Signing key for a token's kid, refreshing once if it is not known yet (key rotation)."""
+        if not self._source:
+            return None
+        if time.monotonic() >= self._expires_at:
+            # Background refresher not running or behind
+            self.refresh()
+
+        generation = self._generation
+        key = self._keys.get(kid)
+        if key is None:
+            with self._refresh_lock:
+                # Another request already refreshed while we waited: reuse its result
+                if self._generation == generation:
+                    # Rate limited so tokens with made-up kids cannot hammer the JWKS endpoint
+                    now = time.monotonic()
+                    if now - self._last_forced >= self.RETRY_SECONDS:
+                        self._last_forced = now
+                        self._load()
+            key = self._keys.get(kid)
+        return key
+
+    def start_refresher(self):
+        """Start the background refresh thread (idempotent)."""
+        if self._refresher and self._refresher.is_alive():
+            return
+        self._stop.clear()
+        self._refresher = threading.Thread(target=self._refresh_loop, name='jwks-refresher', daemon=True)
+        self._refresher.start()
+
+    def stop_refresher(self):
+        self._stop.set()
+
+    def _refresh_loop(self):
+        while True:
+            # Wake before expiry; after a failed fetch, retry every RETRY_SECONDS
+            delay = max(self._expires_at - time.monotonic() - self._ttl * (1 - self.REFRESH_AHEAD_RATIO), self.RETRY_SECONDS)
+            if self._stop.wait(delay):
+                return
+            self.refresh()
+
+    def stats(self):
+        return {'keys': len(self._keys), 'fetches': self.fetches, 'failures': self.failures}
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        if cls._instance is not None:
+            cls._instance.stop_refresher()
+        cls._instance = None
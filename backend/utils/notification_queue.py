@@ -0,0 +1,348 @@
+"""
+Notification Queue Singleton
+Durable outbox for participant notifications, drained by a background worker
+so routes never block on SMTP.
+"""
+import threading
+from datetime import datetime, timedelta
+from typing import Iterator, List, NamedTuple
+
+from sqlalchemy import and_, event, func, insert, literal, or_, select, update
+
+from models import NotificationBatch, NotificationRecipient, Registration, User, db
+
+
+class Participant(NamedTuple):
+    """Lightweight recipient record handed to observers instead of ORM User objects."""
+
+    user_id: int
+    name: str
+    email: str
+
+
+class ParticipantStream:
+    """
+    Lazy, re-iterable view of the recipients one attempt still has to reach.
+    Each iteration streams rows from a server-side cursor in chunks, so observers never hold
+    the whole recipient list; len() is the number left when the attempt started.
+
+    Observers report deliveries with mark_sent(); save_sent() stores them as sent_at, and later
+    attempts skip those rows. Rows marked during this attempt stay visible to every observer.
+    """
+
+    CHUNK_SIZE = 1000
+    SAVE_CHUNK_SIZE = 500
+
+    def __init__(self, batch_id: int):
+        self.batch_id = batch_id
+        self.started_at = datetime.utcnow()
+        self._sent = []
+        self._sent_lock = threading.Lock()
+        self.count = db.session.query(func.count(NotificationRecipient.id)).filter(self._unsent()).scalar()
+
+    def __len__(self):
+        return self.count
+
+    def _unsent(self):
+        return and_(
+            NotificationRecipient.batch_id == self.batch_id,
+            or_(NotificationRecipient.sent_at.is_(None), NotificationRecipient.sent_at >= self.started_at),
+        )
+
+    def __iter__(self) -> Iterator[Participant]:
+        rows = (
+            db.session.query(NotificationRecipient.user_id, NotificationRecipient.name, NotificationRecipient.email)
+            .filter(self._unsent())
+            .order_by(NotificationRecipient.id)
+            .yield_per(self.CHUNK_SIZE)
+        )
+        for row in rows:
+            yield Participant(*row)
+
+    def mark_sent(self, email: str):
+        """Record a delivery; safe to call from the dispatcher's worker threads."""
+        with self._sent_lock:
+            self._sent.append(email)
+
+    def save_sent(self) -> int:
+        """Write pending marks as sent_at in the current session and commit. Returns how many were saved."""
+        with self._sent_lock:
+            emails, self._sent = self._sent, []
+        if not emails:
+            return 0
+        try:
+            now = datetime.utcnow()
+            for start in range(0, len(emails), self.SAVE_CHUNK_SIZE):
+                db.session.execute(
+                    update(NotificationRecipient)
+                    .where(
+                        NotificationRecipient.batch_id == self.batch_id,
+                        NotificationRecipient.email.in_(emails[start:start + self.SAVE_CHUNK_SIZE]),
+                    )
+                    .values(sent_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            with self._sent_lock:
+                self._sent[:0] = emails
+            raise
+        return len(emails)
+
+
+class NotificationQueue:
+    """
+    Singleton outbox for participant notifications.
+    Routes enqueue a batch in their own transaction; the worker claims due batches,
+    hands the recipients to the dispatch callable and records the outcome.
+    """
+
+    _instance = None
+
+    RETRY_BASE_SECONDS = 30
+    # A batch still 'processing' this long after its last lock refresh belongs to a dead worker
+    LOCK_TIMEOUT_SECONDS = 15 * 60
+    # While sending, the worker refreshes locked_at this often, however long the batch takes
+    LOCK_REFRESH_SECONDS = 60
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            cls._instance = super(NotificationQueue, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize only once."""
+        if not hasattr(self, '_initialized'):
+            self._app = None
+            self._dispatch = None
+            self._worker = None
+            self._wake = threading.Event()
+            self._stop = threading.Event()
+            self._poll_interval = 5
+            self._max_attempts = 5
+            self._worker_enabled = True
+            self._initialized = True
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = NotificationQueue()
+        return cls._instance
+
+    def init_app(self, app, dispatch):
+        """
+        Bind the queue to the app.
+
+        Args:
+            app: Flask app (the worker runs inside its app context)
+            dispatch: callable(event_type, event_data, ParticipantStream) -> {'success': int, 'failed': int}
+        """
+        self._app = app
+        self._dispatch = dispatch
+        self._poll_interval = app.config.get('NOTIFICATION_POLL_INTERVAL', 5)
+        self._max_attempts = app.config.get('NOTIFICATION_MAX_ATTEMPTS', 5)
+        self._worker_enabled = app.config.get('NOTIFICATION_WORKER_ENABLED', True)
+        # Wake the worker once the enqueuing transaction is durable
+        event.listen(db.session, 'after_commit', self._after_commit)
+
+    def enqueue(
+        self, event_type: str, event_data: dict, event_id: int, requested_by: int = None, user_ids: List[int] = None
+    ) -> NotificationBatch:
+        """
+        Add a notification batch and snapshot its recipients in the current transaction:
+        the event's registered users, or only those in user_ids.
+        The caller commits together with the change that triggered the notification.
+        """
+        batch = NotificationBatch(
+            event_id=event_id,
+            requested_by=requested_by,
+            event_type=event_type,
+            event_data=event_data,
+            status='pending',
+            next_attempt_at=datetime.utcnow(),
+        )
+        db.session.add(batch)
+        db.session.flush()
+
+        # INSERT ... SELECT: recipients are copied inside the database, never loaded into Python
+        recipients = (
+            select(literal(batch.id), User.id, User.name, User.email)
+            .join(Registration, Registration.user_id == User.id)
+            .where(Registration.event_id == event_id)
+            .order_by(Registration.id)
+        )
+        if user_ids is not None:
+            recipients = recipients.where(Registration.user_id.in_(user_ids))
+        result = db.session.execute(
+            insert(NotificationRecipient).from_select(['batch_id', 'user_id', 'name', 'email'], recipients)
+        )
+        batch.recipient_count = result.rowcount
+        if not batch.recipient_count:
+            batch.status = 'completed'
+            batch.completed_at = datetime.utcnow()
+
+        db.session.info['notification_enqueued'] = True
+        return batch
+
+    def _after_commit(self, session):
+        if session.info.pop('notification_enqueued', False):
+            self.wake()
+
+    def wake(self):
+        """Ask the worker to poll now, starting it if needed."""
+        if self._worker_enabled:
+            self.start_worker()
+        self._wake.set()
+
+    def start_worker(self):
+        """Start the background worker thread (idempotent)."""
+        if self._worker and self._worker.is_alive():
+            return
+        self._stop.clear()
+        self._worker = threading.Thread(target=self.run_forever, name='notification-worker', daemon=True)
+        self._worker.start()
+        print('✅ Notification worker started')
+
+    def stop_worker(self):
+        self._stop.set()
+        self._wake.set()
+
+    def run_forever(self):
+        """Drain due batches, then sleep until woken or the poll interval passes."""
+        while not self._stop.is_set():
+            try:
+                with self._app.app_context():
+                    self.process_pending()
+            except Exception as e:
+                print(f'⚠️ Notification worker error: {str(e)}')
+            self._wake.wait(self._poll_interval)
+            self._wake.clear()
+
+    def process_pending(self) -> int:
+        """Process every due batch. Returns the number of batches handled."""
+        processed = 0
+        while True:
+            batch_id = self._claim_next()
+            if batch_id is None:
+                return processed
+            self._process_batch(batch_id)
+            processed += 1
+
+    def _claimable(self, now):
+        # Due pending batches, or batches whose worker died mid-send
+        stale = now - timedelta(seconds=self.LOCK_TIMEOUT_SECONDS)
+        return or_(
+            and_(NotificationBatch.status == 'pending', NotificationBatch.next_attempt_at <= now),
+            and_(NotificationBatch.status == 'processing', NotificationBatch.locked_at < stale),
+        )
+
+    def _claim_next(self):
+        """Atomically move one due batch to 'processing'; safe with several workers."""
+        while True:
+            now = datetime.utcnow()
+            candidate = (
+                db.session.query(NotificationBatch.id)
+                .filter(self._claimable(now))
+                .order_by(NotificationBatch.next_attempt_at, NotificationBatch.id)
+                .first()
+            )
+            if candidate is None:
+                db.session.commit()
+                return None
+
+            claimed = db.session.execute(
+                update(NotificationBatch)
+                .where(NotificationBatch.id == candidate.id, self._claimable(now))
+                .values(status='processing', locked_at=now, attempts=NotificationBatch.attempts + 1)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.session.commit()
+            if claimed:
+                return candidate.id
+
+    def _process_batch(self, batch_id):
+        batch = db.session.get(NotificationBatch, batch_id)
+        participants = ParticipantStream(batch.id)
+
+        # A rate-limited send can outlast LOCK_TIMEOUT_SECONDS; keep the claim alive until it ends
+        sending = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._refresh_lock,
+            args=(batch_id, participants, sending),
+            name=f'notification-lock-{batch_id}',
+            daemon=True,
+        )
+        heartbeat.start()
+        stats, error = None, None
+        try:
+            stats = self._dispatch(batch.event_type, batch.event_data, participants)
+        except Exception as e:
+            db.session.rollback()
+            error = e
+        finally:
+            sending.set()
+            heartbeat.join()
+
+        # Keep what was delivered even if an observer failed, so a retry skips those recipients
+        participants.save_sent()
+        if error is not None:
+            batch.sent_count = (
+                db.session.query(func.count(NotificationRecipient.id))
+                .filter(NotificationRecipient.batch_id == batch_id, NotificationRecipient.sent_at.isnot(None))
+                .scalar()
+            )
+            self._record_failure(batch, error)
+            return
+
+        batch.sent_count = batch.recipient_count - len(participants) + stats.get('success', 0)
+        batch.failed_count = stats.get('failed', 0)
+        batch.status = 'completed'
+        batch.completed_at = datetime.utcnow()
+        batch.locked_at = None
+        batch.last_error = None
+        db.session.commit()
+
+    def _refresh_lock(self, batch_id, participants, done):
+        """
+        Heartbeat thread: every LOCK_REFRESH_SECONDS until `done` is set, save the deliveries
+        marked so far and move the batch's locked_at forward.
+        """
+        with self._app.app_context():
+            while not done.wait(self.LOCK_REFRESH_SECONDS):
+                try:
+                    participants.save_sent()
+                    db.session.execute(
+                        update(NotificationBatch)
+                        .where(NotificationBatch.id == batch_id, NotificationBatch.status == 'processing')
+                        .values(locked_at=datetime.utcnow())
+                        .execution_options(synchronize_session=False)
+                    )
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    print(f'⚠️ Could not refresh the lock on notification batch #{batch_id}: {str(e)}')
+            db.session.remove()
+
+    def _record_failure(self, batch, error):
+        """Schedule a retry with exponential backoff, or give up after the max attempts."""
+        batch.last_error = str(error)
+        batch.locked_at = None
+        if batch.attempts >= self._max_attempts:
+            batch.status = 'failed'
+            print(f'❌ Notification batch #{batch.id} failed after {batch.attempts} attempts: {str(error)}')
+        else:
+            batch.status = 'pending'
+            delay = self.RETRY_BASE_SECONDS * 2 ** (batch.attempts - 1)
+            batch.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+            print(f'⚠️ Notification batch #{batch.id} failed, retrying in {delay}s: {str(error)}')
+        db.session.commit()
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        if cls._instance is not None:
+            cls._instance.stop_worker()
+        cls._instance = None
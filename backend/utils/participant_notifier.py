@@ -3,10 +3,12 @@ Observer Pattern for Event Participant Notifications
 Notifies registered users when events are updated or cancelled.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
-from models import Registration, User
+from models import NotificationBatch
 from utils.email_service import EmailService
+from utils.email_templates import EmailTemplateRenderer, PreparedEmail
+from utils.notification_queue import NotificationQueue, Participant
 
 
 class ParticipantObserver(ABC):
@@ -15,14 +17,20 @@ class ParticipantObserver(ABC):
     """
 
     @abstractmethod
-    def notify_participants(self, event_type: str, event_data: Dict[str, Any], participants: List[User]) -> None:
+    def notify_participants(
+        self, event_type: str, event_data: Dict[str, Any], participants: Iterable[Participant]
+    ) -> Optional[Dict[str, int]]:
         """
         Notify participants about event changes.
 
         Args:
-            event_type: 'event_updated' or 'event_cancelled'
+            event_type: 'event_updated', 'event_cancelled' or 'waitlist_promoted'
             event_data: Event details
-            participants: List of User objects who registered for the event
+            participants: Lazy, sized iterable of Participant(user_id, name, email) records;
+                may be iterated more than once but should not be materialized
+
+        Returns:
+            Optional dictionary with success/failure counts
         """
         pass
 
@@ -33,17 +41,23 @@ class EmailParticipantNotifier(ParticipantObserver):
     """
 
     def __init__(self):
-        """Initialize with email service."""
+        """Initialize with email service and template renderer."""
         self.email_service = EmailService.get_instance()
+        self.templates = EmailTemplateRenderer.get_instance()
 
-    def notify_participants(self, event_type: str, event_data: Dict[str, Any], participants: List[User]) -> None:
+    def notify_participants(
+        self, event_type: str, event_data: Dict[str, Any], participants: Iterable[Participant]
+    ) -> Dict[str, int]:
         """Send email to all registered participants."""
         if event_type == 'event_updated':
-            self._notify_event_updated(event_data, participants)
+            return self._notify_event_updated(event_data, participants)
         elif event_type == 'event_cancelled':
-            self._notify_event_cancelled(event_data, participants)
+            return self._notify_event_cancelled(event_data, participants)
+        elif event_type == 'waitlist_promoted':
+            return self._notify_waitlist_promoted(event_data, participants)
+        return {'success': 0, 'failed': 0}
 
-    def _notify_event_updated(self, data: Dict[str, Any], participants: List[User]) -> None:
+    def _notify_event_updated(self, data: Dict[str, Any], participants: Iterable[Participant]) -> Dict[str, int]:
         """Notify participants about event updates."""
         event_title = data.get('event_title')
         updated_fields = data.get('updated_fields', [])
@@ -53,47 +67,10 @@ class EmailParticipantNotifier(ParticipantObserver):
         print(f"   Changes: {', '.join(updated_fields)}")
         print(f'   Recipients: {len(participants)} registered participants')
 
-        subject = f'⚠️ Event Update: {event_title}'
-
-        for participant in participants:
-            print(f'   → Sending to {participant.name} ({participant.email})')
-
-            # Create personalized email
-            body = f"""Dear {participant.name},
-
-The event you registered for has been updated:
-
-📅 Event: {event_title}
-🔄 Updated Information: {', '.join(updated_fields)}
-
-Please review the updated event details on the EventSynk platform.
+        prepared = self.templates.prepare('event_updated', {'event_title': event_title, 'updated_fields': updated_fields})
+        return self._send_prepared(prepared, participants)
 
-If you have any questions, please contact the event organizer.
-
-Best regards,
-EventSynk Team"""
-
-            html = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                    <h2 style="color: #2563eb;">Event Update Notification</h2>
-                    <p>Dear <strong>{participant.name}</strong>,</p>
-                    <p>The event you registered for has been updated:</p>
-                    <div style="background-color: #f3f4f6; padding: 15px; border-radius: 5px; margin: 20px 0;">
-                        <p><strong>📅 Event:</strong> {event_title}</p>
-                        <p><strong>🔄 Updated:</strong> {', '.join(updated_fields)}</p>
-                    </div>
-                    <p>Please review the updated event details on the EventSynk platform.</p>
-                    <p>If you have any questions, please contact the event organizer.</p>
-                    <hr style="margin: 30px 0; border: none; border-top: 1px solid #e5e7eb;">
-                    <p style="color: #6b7280; font-size: 12px;">Best regards,<br>EventSynk Team</p>
-                </body>
-            </html>
-            """
-
-            self.email_service.send_email(recipient=participant.email, subject=subject, body=body, html=html)
-
-    def _notify_event_cancelled(self, data: Dict[str, Any], participants: List[User]) -> None:
+    def _notify_event_cancelled(self, data: Dict[str, Any], participants: Iterable[Participant]) -> Dict[str, int]:
         """Notify participants about event cancellation."""
         event_title = data.get('event_title')
         organiser_name = data.get('organiser_name', 'the organizer')
@@ -102,49 +79,34 @@ EventSynk Team"""
         print(f'   Event: {event_title}')
         print(f'   Recipients: {len(participants)} registered participants')
 
-        subject = f'🚫 Event Cancelled: {event_title}'
-
-        for participant in participants:
-            print(f'   → Sending to {participant.name} ({participant.email})')
-
-            # Create personalized email
-            body = f"""Dear {participant.name},
+        prepared = self.templates.prepare('event_cancelled', {'event_title': event_title, 'organiser_name': organiser_name})
+        return self._send_prepared(prepared, participants)
 
-We regret to inform you that the following event has been cancelled:
-
-📅 Event: {event_title}
-👤 Organizer: {organiser_name}
-
-We apologize for any inconvenience this may cause.
+    def _notify_waitlist_promoted(self, data: Dict[str, Any], participants: Iterable[Participant]) -> Dict[str, int]:
+        """Notify users moved from the waitlist to the participant list."""
+        event_title = data.get('event_title')
+        event_date = data.get('event_date')
 
-Your registration has been automatically cancelled, and you will not be charged for this event.
+        print('\n📧 EMAIL NOTIFICATION - Waitlist Promotion')
+        print(f'   Event: {event_title}')
+        print(f'   Recipients: {len(participants)} promoted participants')
 
-Thank you for your understanding.
+        prepared = self.templates.prepare('waitlist_promoted', {'event_title': event_title, 'event_date': event_date})
+        return self._send_prepared(prepared, participants)
 
-Best regards,
-EventSynk Team"""
+    def _send_prepared(self, prepared: PreparedEmail, participants: Iterable[Participant]) -> Dict[str, int]:
+        """
+        Personalize a batch-rendered email per participant and send them in bulk,
+        reporting each delivery back to the stream so a retried batch skips it.
+        """
 
-            html = f"""
-            <html>
-                <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-                    <h2 style="color: #dc2626;">Event Cancellation Notice</h2>
-                    <p>Dear <strong>{participant.name}</strong>,</p>
-                    <p>We regret to inform you that the following event has been cancelled:</p>
-                    <div style="background-color: #fee2e2; padding: 15px; border-left: 4px solid #dc2626;
-                                border-radius: 5px; margin: 20px 0;">
-                        <p><strong>📅 Event:</strong> {event_title}</p>
-                        <p><strong>👤 Organizer:</strong> {organiser_name}</p>
-                    </div>
-                    <p>We apologize for any inconvenience this may cause.</p>
-                    <p>Your registration has been automatically cancelled, and you will not be charged for this event.</p>
-                    <p>Thank you for your understanding.</p>
-                    <hr style="margin: 30px 0; border: none; border-top: 1px solid #e5e7eb;">
-                    <p style="color: #6b7280; font-size: 12px;">Best regards,<br>EventSynk Team</p>
-                </body>
-            </html>
-            """
+        def messages():
+            for participant in participants:
+                print(f'   → Sending to {participant.name} ({participant.email})')
+                subject, body, html = prepared.render(participant.name)
+                yield participant.email, subject, body, html
 
-            self.email_service.send_email(recipient=participant.email, subject=subject, body=body, html=html)
+        return self.email_service.send_messages(messages(), on_sent=getattr(participants, 'mark_sent', None))
 
 
 class EventNotificationManager:
@@ -186,34 +148,61 @@ class EventNotificationManager:
         if observer in self._observers:
             self._observers.remove(observer)
 
-    def notify_registered_users(self, event_type: str, event_data: Dict[str, Any], event_id: int) -> None:
+    def notify_registered_users(
+        self,
+        event_type: str,
+        event_data: Dict[str, Any],
+        event_id: int,
+        requested_by: int = None,
+        user_ids: Optional[List[int]] = None,
+    ) -> NotificationBatch:
         """
-        Notify all registered participants about event changes.
+        Queue a notification for all registered participants (or only user_ids) about event changes.
+        Recipients are snapshotted in the caller's transaction; delivery happens in the
+        background worker once the caller commits.
 
         Args:
-            event_type: 'event_updated' or 'event_cancelled'
+            event_type: 'event_updated', 'event_cancelled' or 'waitlist_promoted'
             event_data: Event details
             event_id: ID of the event
-        """
-        # Get all participants registered for this event
-        registrations = Registration.query.filter_by(event_id=event_id).all()
+            requested_by: ID of the user who triggered the notification
+            user_ids: Limit the recipients to these registered users
 
-        if not registrations:
+        Returns:
+            The queued NotificationBatch (its id can be polled for delivery status)
+        """
+        batch = NotificationQueue.get_instance().enqueue(event_type, event_data, event_id, requested_by, user_ids)
+        if not batch.recipient_count:
             print(f'ℹ️  No registered participants to notify for event #{event_id}')
-            return
-
-        # Get User objects for all participants
-        participant_ids = [reg.user_id for reg in registrations]
-        participants = User.query.filter(User.id.in_(participant_ids)).all()
+        else:
+            print(f'\n🔔 Queued {event_type} notification for {batch.recipient_count} participants (batch #{batch.id})')
+        return batch
 
+    def notify_participants(
+        self, event_type: str, event_data: Dict[str, Any], participants: Iterable[Participant]
+    ) -> Dict[str, int]:
+        """
+        Deliver a notification to every observer. Called by the notification worker.
+        Raises if any observer fails, so the batch is retried.
+        """
         print(f'\n🔔 Notifying {len(participants)} registered participants about: {event_type}')
 
-        # Notify all observers
+        stats = {'success': 0, 'failed': 0}
+        errors = []
         for observer in self._observers:
             try:
-                observer.notify_participants(event_type, event_data, participants)
+                result = observer.notify_participants(event_type, event_data, participants)
             except Exception as e:
                 print(f'⚠️ Error in {observer.__class__.__name__}: {str(e)}')
+                errors.append(f'{observer.__class__.__name__}: {str(e)}')
+                continue
+            if result:
+                stats['success'] += result.get('success', 0)
+                stats['failed'] += result.get('failed', 0)
+
+        if errors:
+            raise RuntimeError('; '.join(errors))
+        return stats
 
     @classmethod
     def reset_instance(cls):
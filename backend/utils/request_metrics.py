@@ -0,0 +1,269 @@
+"""
+Request Metrics Singleton
+Per-route instrumentation: latency histogram, SQL statement count and time (from SQLAlchemy cursor events),
+response size and the shape of the slowest statement seen (literals stripped). Rendered in Prometheus text
+format at /metrics and as JSON at /api/metrics/routes, both behind METRICS_TOKEN. Optionally adds a
+Server-Timing header, and warns when a request runs more statements than QUERY_BUDGET (usually an N+1 loop).
+"""
+import re
+import threading
+import time
+from typing import Dict
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MAX_STATEMENT_CHARS = 300
+# Literals a statement may carry inline (bound parameters are already placeholders)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_statement(statement):
+    """Statement shape for reporting: literals replaced by ?, whitespace collapsed, truncated."""
+    if not statement:
+        return None
+    shape = _WHITESPACE.sub(' ', _LITERALS.sub('?', statement)).strip()
+    return shape[:MAX_STATEMENT_CHARS]
+
+
+class _Sample:
+    """Measurements for the request in flight, kept on flask.g."""
+
+    __slots__ = ('start', 'queries', 'db_seconds', 'slowest_seconds', 'slowest_statement')
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement = None
+
+
+class _RouteStats:
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.statuses = {}
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.response_bytes = 0
+        self.streamed = 0
+        self.budget_exceeded = 0
+        self.max_queries = 0
+        self.slowest_seconds = 0.0
+        self.slowest_statement = None
+
+
+class RequestMetrics:
+    """Singleton collecting per-route request metrics for the process."""
+
+    _instance = None
+    _listening = False
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            cls._instance = super(RequestMetrics, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize only once."""
+        if not hasattr(self, '_initialized'):
+            self.query_budget = 25
+            self.server_timing = False
+            self._routes = {}
+            self._lock = threading.Lock()
+            self._initialized = True
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = RequestMetrics()
+        return cls._instance
+
+    def init_app(self, app):
+        """
+        Register the request hooks and SQL listeners. Call before other after_request hooks that change
+        the body (compression), so the recorded size is what goes on the wire.
+        """
+        self.query_budget = app.config.get('QUERY_BUDGET', 25)
+        self.server_timing = app.config.get('SERVER_TIMING', False)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        if not RequestMetrics._listening:
+            # Engine class-level listeners cover every engine, including replicas and ones created later
+            event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+            event.listen(Engine, 'handle_error', self._on_error)
+            RequestMetrics._listening = True
+        print(f'✅ Request metrics enabled (query budget {self.query_budget or "off"})')
+
+    # SQL statements
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('metrics_query_start', []).append(time.perf_counter())
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get('metrics_query_start')
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        sample = g.get('request_metrics') if has_request_context() else None
+        if sample is None:
+            return
+        sample.queries += 1
+        sample.db_seconds += elapsed
+        if elapsed > sample.slowest_seconds:
+            sample.slowest_seconds = elapsed
+            sample.slowest_statement = statement
+
+    @staticmethod
+    def _on_error(context):
+        # A failed statement never reaches after_cursor_execute; drop its start time
+        started = context.connection.info.get('metrics_query_start') if context.connection is not None else None
+        if started:
+            started.pop()
+
+    # Requests
+
+    @staticmethod
+    def _start_request():
+        g.request_metrics = _Sample()
+
+    @staticmethod
+    def _route():
+        return request.endpoint or 'unmatched'
+
+    def _finish_request(self, response):
+        sample = g.pop('request_metrics', None)
+        if sample is None:
+            return response
+        elapsed = time.perf_counter() - sample.start
+        route, method = self._route(), request.method
+        # A streamed body's size is unknown until it has been sent; those responses are counted apart
+        streamed = response.is_streamed
+        size = 0 if streamed else response.calculate_content_length() or 0
+
+        over_budget = bool(self.query_budget) and sample.queries > self.query_budget
+        if over_budget:
+            print(
+                f'⚠️  {method} {route} ran {sample.queries} SQL statements (budget {self.query_budget}), '
+                f'possible N+1; slowest: {(normalize_statement(sample.slowest_statement) or "")[:120]}'
+            )
+
+        with self._lock:
+            stats = self._routes.setdefault((route, method), _RouteStats())
+            stats.count += 1
+            stats.seconds += elapsed
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if elapsed <= bound:
+                    stats.buckets[i] += 1
+            stats.statuses[response.status_code] = stats.statuses.get(response.status_code, 0) + 1
+            stats.queries += sample.queries
+            stats.db_seconds += sample.db_seconds
+            stats.response_bytes += size
+            stats.streamed += streamed
+            stats.budget_exceeded += over_budget
+            stats.max_queries = max(stats.max_queries, sample.queries)
+            if sample.slowest_seconds > stats.slowest_seconds:
+                stats.slowest_seconds = sample.slowest_seconds
+                stats.slowest_statement = normalize_statement(sample.slowest_statement)
+
+        if self.server_timing:
+            response.headers.add(
+                'Server-Timing',
+                f'db;dur={sample.db_seconds * 1000:.1f};desc="{sample.queries} queries", app;dur={elapsed * 1000:.1f}',
+            )
+        return response
+
+    # Reporting
+
+    def stats(self) -> Dict[str, dict]:
+        """Per-route summary for the JSON endpoint, keyed 'METHOD endpoint'."""
+        with self._lock:
+            return {
+                f'{method} {route}': {
+                    'requests': s.count,
+                    'avg_ms': round(s.seconds / s.count * 1000, 3),
+                    'statuses': dict(s.statuses),
+                    'avg_queries': round(s.queries / s.count, 2),
+                    'max_queries': s.max_queries,
+                    'avg_db_ms': round(s.db_seconds / s.count * 1000, 3),
+                    'avg_response_bytes': round(s.response_bytes / (s.count - s.streamed)) if s.count > s.streamed else None,
+                    'streamed_responses': s.streamed,
+                    'query_budget_exceeded': s.budget_exceeded,
+                    'slowest_query_ms': round(s.slowest_seconds * 1000, 3),
+                    'slowest_query': s.slowest_statement,
+                }
+                for (route, method), s in sorted(self._routes.items())
+            }
+
+    def prometheus(self, pools: Dict[str, dict] = None) -> str:
+        """Prometheus text exposition of the route metrics, plus connection pool gauges when given."""
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+
+        def sample(name, labels, value):
+            rendered = ','.join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            lines.append(f'{name}{{{rendered}}} {value}')
+
+        counters = (
+            ('eventsynk_db_queries_total', 'SQL statements executed by route.', lambda s: s.queries),
+            ('eventsynk_db_query_seconds_total', 'Time spent in SQL statements by route.', lambda s: round(s.db_seconds, 6)),
+            ('eventsynk_response_bytes_total', 'Non-streamed response body bytes by route.', lambda s: s.response_bytes),
+            ('eventsynk_streamed_responses_total', 'Streamed responses (size not measured) by route.', lambda s: s.streamed),
+            ('eventsynk_query_budget_exceeded_total', 'Requests over QUERY_BUDGET statements.', lambda s: s.budget_exceeded),
+        )
+
+        with self._lock:
+            routes = [({'route': route, 'method': method}, s) for (route, method), s in sorted(self._routes.items())]
+
+            family('eventsynk_request_duration_seconds', 'histogram', 'Request latency by route.')
+            for labels, s in routes:
+                for bound, count in zip(LATENCY_BUCKETS, s.buckets):
+                    sample('eventsynk_request_duration_seconds_bucket', {**labels, 'le': bound}, count)
+                sample('eventsynk_request_duration_seconds_bucket', {**labels, 'le': '+Inf'}, s.count)
+                sample('eventsynk_request_duration_seconds_sum', labels, round(s.seconds, 6))
+                sample('eventsynk_request_duration_seconds_count', labels, s.count)
+
+            family('eventsynk_requests_total', 'counter', 'Requests by route and status code.')
+            for labels, s in routes:
+                for status, count in sorted(s.statuses.items()):
+                    sample('eventsynk_requests_total', {**labels, 'status': status}, count)
+
+            for name, help_text, value in counters:
+                family(name, 'counter', help_text)
+                for labels, s in routes:
+                    sample(name, labels, value(s))
+
+            family('eventsynk_slowest_query_seconds', 'gauge', 'Slowest SQL statement seen by route.')
+            for labels, s in routes:
+                sample('eventsynk_slowest_query_seconds', labels, round(s.slowest_seconds, 6))
+
+        if pools:
+            family('eventsynk_db_pool_connections', 'gauge', 'Pooled database connections by state.')
+            for engine, stats in sorted(pools.items()):
+                for state in ('in_use', 'idle', 'overflow'):
+                    if state in stats:
+                        sample('eventsynk_db_pool_connections', {'engine': engine, 'state': state}, stats[state])
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing). SQL listeners stay registered and feed the new instance's requests."""
+        cls._instance = None
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
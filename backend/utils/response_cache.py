@@ -0,0 +1,318 @@
+"""
+Response Cache Singleton
+Read-through cache for event detail and listing responses with precise invalidation on writes.
+Backends: in-process LRU with TTL (default) or any Redis-compatible server (optional `redis` package).
+"""
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import wraps
+from typing import Dict, Optional
+
+from flask import Response, g, request
+
+from utils.compression import ResponseCompressor
+
+
+class CacheBackend(ABC):
+    """Minimal key/value interface the response cache needs."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment an integer counter (created at 1), never expiring."""
+        pass
+
+    def get_counter(self, key: str) -> int:
+        value = self.get(key)
+        return int(value) if value is not None else 0
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+class InMemoryLRUCache(CacheBackend):
+    """Thread-safe LRU with per-entry TTL, local to one process."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at or None, value)
+        self._counters = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key, value, expires_at):
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._store(key, value, time.monotonic() + ttl if ttl else None)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key):
+        # Counters live outside the LRU so they are never evicted
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def get_counter(self, key):
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
+
+
+class RedisCache(CacheBackend):
+    """Shared cache on a Redis-compatible server; entries expire server-side."""
+
+    def __init__(self, url: str, prefix: str = 'eventsynk:'):
+        import redis  # Optional dependency, only needed for CACHE_BACKEND=redis
+
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key):
+        return self._client.get(self._prefix + key)
+
+    def set(self, key, value, ttl):
+        self._client.set(self._prefix + key, value, ex=ttl or None)
+
+    def delete(self, key):
+        self._client.delete(self._prefix + key)
+
+    def incr(self, key):
+        return self._client.incr(self._prefix + key)
+
+    def stats(self):
+        info = self._client.info('stats')
+        return {'evictions': info.get('evicted_keys', 0), 'expirations': info.get('expired_keys', 0)}
+
+
+class ResponseCache:
+    """
+    Singleton read-through cache for JSON GET responses.
+
+    Event detail responses are keyed per event. Listing responses are keyed per normalized
+    query string under a listing generation number; any event write bumps the generation,
+    so all listing variants are invalidated in O(1) and age out of the backend.
+    """
+
+    _instance = None
+
+    LISTING_GENERATION_KEY = 'events:generation'
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            cls._instance = super(ResponseCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize only once."""
+        if not hasattr(self, '_initialized'):
+            self._backend = None
+            self._ttl = 60
+            self._replica_lag = 5
+            self._last_invalidation = 0.0
+            self._lock = threading.Lock()
+            self.hits = 0
+            self.misses = 0
+            self.stale = 0
+            self.invalidations = 0
+            self._initialized = True
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = ResponseCache()
+        return cls._instance
+
+    def init_app(self, app):
+        """Build the backend from CACHE_BACKEND ('memory', 'redis' or 'none')."""
+        backend = app.config.get('CACHE_BACKEND', 'memory')
+        self._ttl = app.config.get('CACHE_DEFAULT_TTL', 60)
+        self._replica_lag = app.config.get('DB_REPLICA_STICKY_SECONDS', 5)
+        if backend == 'redis':
+            self._backend = RedisCache(app.config['CACHE_REDIS_URL'])
+        elif backend == 'memory':
+            self._backend = InMemoryLRUCache(app.config.get('CACHE_MAX_ENTRIES', 1024))
+        else:
+            self._backend = None
+        print(f'✅ Response cache initialized ({backend})')
+
+    @property
+    def enabled(self) -> bool:
+        return self._backend is not None
+
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        """The configured backend, or None when caching is off (DatabaseManager also keeps write markers in Redis)."""
+        return self._backend
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    # Keys
+
+    @staticmethod
+    def event_key(event_id: int) -> str:
+        return f'event:{event_id}'
+
+    @staticmethod
+    def variant_key(key: str, encoding: str) -> str:
+        """Compressed copy of the entry at `key`."""
+        return f'{key}|{encoding}'
+
+    def listing_key(self, scope: str = 'events') -> str:
+        """
+        Key for the current listing request: generation plus sorted query arguments.
+        Other responses derived from the whole event table (e.g. facets) pass their own scope.
+        """
+        generation = self._backend.get_counter(self.LISTING_GENERATION_KEY)
+        args = '&'.join(f'{k}={v}' for k, v in sorted(request.args.items(multi=True)))
+        return f'{scope}:{generation}:{args}'
+
+    # Read-through
+
+    def cached(self, key_func, ttl: int = None):
+        """
+        Decorator for GET views returning JSON: serve the cached body on a hit, store 200 responses on a miss.
+        key_func receives the view's keyword arguments.
+
+        Under @conditional, bodies are stored with the ETag they were built under (g.http_etag) and served only
+        while it is still current; a tag that moved means a change the key does not capture (e.g. an organiser's
+        profile), so the entry is rebuilt rather than sent under a validator it does not match.
+        """
+
+        def decorator(f):
+            @wraps(f)
+            def decorated(*args, **kwargs):
+                if not self.enabled:
+                    return f(*args, **kwargs)
+
+                key = key_func(**kwargs)
+                etag = g.get('http_etag') or ''
+                entry = self._backend.get(key)
+                if entry is not None:
+                    stored_etag, _, body = entry.partition(b'\n')
+                    if stored_etag.decode('ascii', 'replace') == etag:
+                        self._count('hits')
+                        return self._hit_response(key, body, ttl or self._ttl)
+                    self._count('stale')
+
+                self._count('misses')
+                rv = f(*args, **kwargs)
+                response, status = rv if isinstance(rv, tuple) else (rv, 200)
+                if status == 200 and not self._maybe_stale():
+                    self._backend.set(key, etag.encode('ascii') + b'\n' + response.get_data(), ttl or self._ttl)
+                return rv
+
+            return decorated
+
+        return decorator
+
+    def _hit_response(self, key, body, ttl):
+        """
+        The cached body, in the encoding this client negotiates. Each compressed variant is built once and stored
+        next to the entry (tagged with a digest of the body it came from), so hits are not re-compressed.
+        """
+        compressor = ResponseCompressor.get_instance()
+        encoding = compressor.negotiate(len(body))
+        if encoding is None:
+            return Response(body, status=200, mimetype='application/json')
+
+        variant_key = self.variant_key(key, encoding)
+        # Checksum, not a cryptographic hash: it only tells a rebuilt entry apart, and costs far less than compressing
+        digest = f'{zlib.crc32(body):08x}:{len(body)}'.encode('ascii')
+        variant = self._backend.get(variant_key)
+        stored_digest, _, data = variant.partition(b'\n') if variant is not None else (None, None, None)
+        if stored_digest != digest:
+            data = compressor.encode(body, encoding)
+            self._backend.set(variant_key, digest + b'\n' + data, ttl)
+        compressor.record(encoding, len(body), len(data))
+
+        response = Response(data, status=200, mimetype='application/json')
+        response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        return response
+
+    def _maybe_stale(self) -> bool:
+        """A response read from a replica right after a write may predate it; serve it but don't cache it."""
+        return bool(g.get('db_replica_used')) and time.monotonic() - self._last_invalidation < self._replica_lag
+
+    # Invalidation
+
+    def invalidate_event(self, event_id: int = None) -> None:
+        """Drop one event's detail response and every listing variant."""
+        if not self.enabled:
+            return
+        if event_id is not None:
+            key = self.event_key(event_id)
+            self._backend.delete(key)
+            for encoding in ResponseCompressor.encodings():
+                self._backend.delete(self.variant_key(key, encoding))
+        self._backend.incr(self.LISTING_GENERATION_KEY)
+        self._last_invalidation = time.monotonic()
+        self._count('invalidations')
+
+    def stats(self) -> Dict[str, int]:
+        lookups = self.hits + self.misses
+        stats = {
+            'enabled': self.enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'stale': self.stale,
+            'invalidations': self.invalidations,
+        }
+        if self.enabled:
+            stats.update(self._backend.stats())
+        return stats
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        cls._instance = None
@@ -0,0 +1,102 @@
+"""
+Verified Token Cache Singleton
+Claims of already-verified bearer tokens, kept until the token expires, so a client repeating the
+same token skips the signature check. Shared by clerk_token_required and the legacy token_required.
+"""
+import hashlib
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from utils.response_cache import InMemoryLRUCache
+
+
+class VerifiedTokenCache:
+    """
+    Singleton LRU of sha256(token) -> verified claims.
+    Only successful verifications of tokens carrying `exp` are cached, never past `exp`.
+    Tracks hit rate and the verification CPU time avoided by hits.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        """Singleton pattern implementation."""
+        if cls._instance is None:
+            cls._instance = super(VerifiedTokenCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize only once."""
+        if not hasattr(self, '_initialized'):
+            self._cache = InMemoryLRUCache(4096)
+            self._max_ttl = 3600
+            self._enabled = True
+            self._lock = threading.Lock()
+            self.hits = 0
+            self.misses = 0
+            self.verify_cpu_seconds = 0.0
+            self.cpu_saved_seconds = 0.0
+            self._initialized = True
+
+    @classmethod
+    def get_instance(cls):
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = VerifiedTokenCache()
+        return cls._instance
+
+    def init_app(self, app):
+        max_entries = app.config.get('TOKEN_CACHE_MAX_ENTRIES', 4096)
+        self._enabled = max_entries > 0
+        self._cache = InMemoryLRUCache(max_entries or 1)
+        self._max_ttl = app.config.get('TOKEN_CACHE_MAX_TTL', 3600)
+
+    def verify(self, token: str, verifier: Callable[[str], Optional[dict]], namespace: str) -> Optional[dict]:
+        """
+        Claims for a token, from the cache or by calling verifier(token) (which returns None when invalid).
+        namespace separates token types verified by different functions.
+        """
+        if not self._enabled:
+            return verifier(token)
+
+        key = f'{namespace}:{hashlib.sha256(token.encode("utf-8")).hexdigest()}'
+        entry = self._cache.get(key)
+        if entry is not None:
+            claims, cost = entry
+            with self._lock:
+                self.hits += 1
+                self.cpu_saved_seconds += cost
+            return claims
+
+        start = time.thread_time()
+        claims = verifier(token)
+        cost = time.thread_time() - start
+        with self._lock:
+            self.misses += 1
+            self.verify_cpu_seconds += cost
+
+        exp = claims.get('exp') if claims else None
+        if isinstance(exp, (int, float)):
+            ttl = min(exp - time.time(), self._max_ttl)
+            if ttl > 0:
+                self._cache.set(key, (claims, cost), ttl)
+        return claims
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        stats = {
+            'enabled': self._enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'verify_cpu_ms': round(self.verify_cpu_seconds * 1000, 3),
+            'cpu_saved_ms': round(self.cpu_saved_seconds * 1000, 3),
+        }
+        stats.update(self._cache.stats())
+        return stats
+
+    @classmethod
+    def reset_instance(cls):
+        """Reset singleton (for testing)."""
+        cls._instance = None